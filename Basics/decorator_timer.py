@@ -2,10 +2,10 @@ import time
 
 def timer(func):
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()  # monotonic, high resolution (time.time can jump)
         result = func(*args, **kwargs)
-        end = time.time()
-        print(f"Execution time: {end - start:.4f}s")
+        end = time.perf_counter()
+        print(f"Execution time: {end - start:.6f}s")
         return result
     return wrapper
 
@@ -15,3 +15,4 @@ def slow_add(x, y):
     return x**y+y**x
 
 print(slow_add(3, 5))
+# for functions called in a loop see Utilities/instrument.py (histograms, no print per call)
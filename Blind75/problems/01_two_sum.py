@@ -28,4 +28,208 @@ def two_sum(nums, target):
             return [num_to_index[complement], index]
         num_to_index[num] = index
     
-    return []  # In case there is no solution, though the problem guarantees one.
\ No newline at end of file
+    return []  # In case there is no solution, though the problem guarantees one.
+
+
+# Many targets against the same array: PairSumIndex does the O(n) / O(nlogn)
+# preprocessing once instead of a fresh dict per call.
+#
+#     idx = PairSumIndex(nums)                 # backend='hash' | 'sorted' | 'numpy'
+#     idx.two_sum(9)                           # same answer shape as two_sum
+#     idx.two_sum_many([9, 13, 26])            # one answer per target
+#     idx.count_pairs(9)                       # number of index pairs i < j
+#     idx.three_sum(0), idx.four_sum(10)       # unique value tuples, no duplicates
+#
+# hash:   value -> count and first two indices; a target costs O(distinct values)
+# sorted: sorted values + original positions, two pointers from both ends, O(n)
+# numpy:  (default for numpy integer arrays) sorted values, every target is a
+#         vectorized searchsorted of target - values, no python loop per element
+# k-sum always works on the sorted values: fix the smallest value, recurse,
+# two pointers for the last two; equal values are skipped at every level.
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class PairSumIndex:
+    BACKENDS = ('hash', 'sorted', 'numpy')
+
+    def __init__(self, nums, backend=None):
+        is_np = np is not None and isinstance(nums, np.ndarray)
+        if backend is None:
+            backend = 'numpy' if is_np and nums.dtype.kind in 'iu' else 'hash'
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend must be one of {self.BACKENDS}")
+        if backend == 'numpy' and np is None:
+            raise ImportError("the numpy backend needs numpy")
+        self.backend = backend
+        self.n = len(nums)
+        self.nums = nums
+        self._sorted = None
+        if backend == 'hash':
+            self.count, self.first, self.second = {}, {}, {}
+            for i, x in enumerate(nums.tolist() if is_np else nums):
+                c = self.count.get(x, 0)
+                if c == 0:
+                    self.first[x] = i
+                elif c == 1:
+                    self.second[x] = i
+                self.count[x] = c + 1
+        elif backend == 'numpy':
+            a = np.asarray(nums).astype(np.int64, copy=False)
+            self.order = np.argsort(a, kind='stable')
+            self.vals = a[self.order]
+            self.uniq, self.ucount = np.unique(self.vals, return_counts=True)
+        else:
+            self._sorted_view()
+
+    # (sorted values, original index of each) as python lists
+    def _sorted_view(self):
+        if self._sorted is None:
+            if self.backend == 'numpy':
+                self._sorted = (self.vals.tolist(), self.order.tolist())
+            else:
+                nums = self.nums.tolist() if np is not None and isinstance(self.nums, np.ndarray) else self.nums
+                order = sorted(range(self.n), key=nums.__getitem__)
+                self._sorted = ([nums[i] for i in order], order)
+        return self._sorted
+
+    # --- two sum ----------------------------------------------------------
+
+    def two_sum(self, target):
+        if self.backend == 'hash':
+            for x, i in self.first.items():
+                c = target - x
+                if c != x and c in self.first:
+                    return sorted([i, self.first[c]])
+                if c == x and x in self.second:
+                    return [i, self.second[x]]
+            return []
+        if self.backend == 'numpy':
+            return self._two_sum_np(target)
+        vals, order = self._sorted_view()
+        lo, hi = 0, self.n - 1
+        while lo < hi:
+            s = vals[lo] + vals[hi]
+            if s == target:
+                return sorted([order[lo], order[hi]])
+            if s < target:
+                lo += 1
+            else:
+                hi -= 1
+        return []
+
+    def _two_sum_np(self, target):
+        comp = target - self.vals
+        left = np.searchsorted(self.vals, comp, 'left')
+        right = np.searchsorted(self.vals, comp, 'right')
+        # complement present, and not only as the element itself
+        ok = (right - left) > (comp == self.vals)
+        hits = np.flatnonzero(ok)
+        if not len(hits):
+            return []
+        i = int(hits[0])
+        j = int(left[i]) if left[i] != i else int(left[i]) + 1
+        return sorted([int(self.order[i]), int(self.order[j])])
+
+    def two_sum_many(self, targets):
+        return [self.two_sum(t) for t in targets]
+
+    # --- pair counts ------------------------------------------------------
+
+    # number of index pairs i < j with nums[i] + nums[j] == target
+    def count_pairs(self, target):
+        if self.n < 2:
+            return 0
+        if self.backend == 'numpy':
+            comp = target - self.uniq
+            idx = np.minimum(np.searchsorted(self.uniq, comp), len(self.uniq) - 1)
+            match = self.uniq[idx] == comp
+            ordered = int((self.ucount * np.where(match, self.ucount[idx], 0)).sum())
+            ordered -= int(self.ucount[2 * self.uniq == target].sum())  # i paired with itself
+            return ordered // 2
+        if self.backend == 'hash':
+            ordered = sum(c * self.count.get(target - x, 0) for x, c in self.count.items())
+            self_pairs = sum(c for x, c in self.count.items() if 2 * x == target)
+            return (ordered - self_pairs) // 2
+        vals, _ = self._sorted_view()
+        res, lo, hi = 0, 0, self.n - 1
+        while lo < hi:
+            s = vals[lo] + vals[hi]
+            if s < target:
+                lo += 1
+            elif s > target:
+                hi -= 1
+            elif vals[lo] == vals[hi]:  # everything in between is equal too
+                k = hi - lo + 1
+                return res + k * (k - 1) // 2
+            else:
+                a, b = lo, hi
+                while vals[lo] == vals[a]:
+                    lo += 1
+                while vals[hi] == vals[b]:
+                    hi -= 1
+                res += (lo - a) * (b - hi)
+        return res
+
+    def count_pairs_many(self, targets):
+        return [self.count_pairs(t) for t in targets]
+
+    # --- k sum ------------------------------------------------------------
+
+    # unique sorted value tuples of k elements (distinct positions) adding up to target
+    def k_sum(self, target, k):
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        vals, _ = self._sorted_view()
+        res = []
+        self._k_sum(vals, 0, target, k, [], res)
+        return res
+
+    def _k_sum(self, vals, start, target, k, prefix, res):
+        n = len(vals)
+        if n - start < k:
+            return
+        # the k smallest are already too big / the k largest too small
+        if sum(vals[start:start + k]) > target or sum(vals[n - k:]) < target:
+            return
+        if k == 2:
+            lo, hi = start, n - 1
+            while lo < hi:
+                s = vals[lo] + vals[hi]
+                if s < target:
+                    lo += 1
+                elif s > target:
+                    hi -= 1
+                else:
+                    res.append(tuple(prefix) + (vals[lo], vals[hi]))
+                    x = vals[lo]
+                    while lo < hi and vals[lo] == x:
+                        lo += 1
+            return
+        for i in range(start, n - k + 1):
+            if i > start and vals[i] == vals[i - 1]:
+                continue
+            prefix.append(vals[i])
+            self._k_sum(vals, i + 1, target - vals[i], k - 1, prefix, res)
+            prefix.pop()
+
+    def three_sum(self, target=0):
+        return self.k_sum(target, 3)
+
+    def four_sum(self, target):
+        return self.k_sum(target, 4)
+
+
+if __name__ == "__main__":
+    print(two_sum([2, 7, 11, 15], 9))
+    nums = [2, 7, 11, 15, -1, 0, 1, 2, -1, -4]
+    for backend in ('hash', 'sorted'):
+        idx = PairSumIndex(nums, backend)
+        print(backend, idx.two_sum_many([9, 13, 4, 100]), idx.count_pairs_many([1, 4]))
+    idx = PairSumIndex(nums)
+    print(idx.three_sum(0), idx.four_sum(2))
+    if np is not None:
+        idx = PairSumIndex(np.array(nums))
+        print('numpy', idx.two_sum_many([9, 13, 4, 100]), idx.count_pairs_many([1, 4]))
@@ -1,13 +1,177 @@
+import os
+import shutil
+import sys
+import tempfile
 from collections import defaultdict
+from math import prod
+
+# anagrams have the same multiset of letters. Instead of sorting every word
+# (O(k log k)), every character gets its own prime and the key is the product
+# of the primes of the word's characters: O(k) multiplications done in C
+# (math.prod over map), and by unique factorisation two words get the same
+# product exactly when they are anagrams. Frequent letters get the small
+# primes so the products stay small; other characters get the next unused
+# prime the first time they show up.
+class _Primes(dict):
+    def __init__(self):
+        super().__init__()
+        self.last = 1
+        for c in 'etaoinshrdlcumwfgypbvkjxqz':
+            self[c]
+
+    def __missing__(self, c):
+        p = self.last + 1
+        while any(p % d == 0 for d in range(2, int(p ** 0.5) + 1)):
+            p += 1
+        self[c] = self.last = p
+        return p
+
+_PRIMES = _Primes()
+
+def signature(word):
+    return prod(map(_PRIMES.__getitem__, word))
 
 class Solution:
-    def groupAnagrams(self, strs):    
+    def groupAnagrams(self, strs):
         ans = defaultdict(list)
 
         for s in strs:
-            key = "".join(sorted(s))
-            ans[key].append(s)
-        
+            ans[signature(s)].append(s)
+
         return list(ans.values())
-    
-print(Solution().groupAnagrams(["eat","tea","tan","ate","nat","bat"]))
\ No newline at end of file
+
+
+# Grouping a stream of words that may not fit in memory.
+#
+#   g = AnagramGrouper(memory=256 << 20)
+#   g.extend(words(open('corpus.txt')))
+#   for group in g.groups(): ...            # lists of anagrams
+#   for word, n in g.counts(): ...          # one word of the group, group size
+#
+# Groups live in a dict keyed by signature. Once their estimated size goes
+# over `memory` they are spilled to `partitions` files on disk (partition from
+# the signature, so a whole group always lands in the same file) and
+# the dict starts again empty. groups() / counts() then load one partition at
+# a time, so only about 1/partitions of the data is in memory at once.
+# keep_members=False only keeps (count, first word) per group: counts() works
+# in memory proportional to the number of distinct groups, groups() is off.
+# Words must not contain '\n' (one word per line in the spill files).
+
+# signatures are products of small primes, so signature % partitions is far
+# from uniform (a partition count among the letter primes even gets every word
+# with that letter). Fibonacci hashing of hash(signature) spreads them evenly.
+def _partition(key, partitions):
+    return ((hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) * partitions >> 64
+
+class AnagramGrouper:
+    def __init__(self, memory=64 << 20, partitions=64, keep_members=True, tmpdir=None):
+        self.memory, self.partitions = memory, partitions
+        self.keep_members = keep_members
+        self.tmpdir = tmpdir
+        self.groups_ = {}   # signature -> list of words, or [count, first word]
+        self.used = 0       # estimated bytes held by groups_
+        self.spill_dir = None
+
+    def add(self, word):
+        key = signature(word)
+        g = self.groups_.get(key)
+        if g is None:
+            g = self.groups_[key] = [] if self.keep_members else [0, word]
+            self.used += 120 + sys.getsizeof(word)  # dict slot + key + list / first word
+        if self.keep_members:
+            g.append(word)
+            self.used += 8 + sys.getsizeof(word)
+        else:
+            g[0] += 1
+        if self.used > self.memory:
+            self._spill()
+
+    def extend(self, words):
+        for w in words:
+            self.add(w)
+        return self
+
+    # spill lines are "count<TAB>word"; members are written with count 1
+    def _spill(self):
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='anagrams', dir=self.tmpdir)
+        files = {}
+        try:
+            for key, g in self.groups_.items():
+                p = _partition(key, self.partitions)
+                f = files.get(p)
+                if f is None:
+                    f = files[p] = open(os.path.join(self.spill_dir, f"{p}.txt"), 'a',
+                                        encoding='utf-8', errors='surrogateescape')
+                if self.keep_members:
+                    f.writelines(f"1\t{w}\n" for w in g)
+                else:
+                    f.write(f"{g[0]}\t{g[1]}\n")
+        finally:
+            for f in files.values():
+                f.close()
+        self.groups_, self.used = {}, 0
+
+    # {signature: group} of one partition file, merged
+    def _load(self, path):
+        groups = {}
+        with open(path, encoding='utf-8', errors='surrogateescape') as f:
+            for line in f:
+                n, w = line[:-1].split('\t', 1)
+                key = signature(w)
+                g = groups.get(key)
+                if self.keep_members:
+                    if g is None:
+                        g = groups[key] = []
+                    g.append(w)
+                elif g is None:
+                    groups[key] = [int(n), w]
+                else:
+                    g[0] += int(n)
+        return groups
+
+    def _all(self):
+        if self.spill_dir is None:
+            yield from self.groups_.values()
+            return
+        if self.groups_:
+            self._spill()
+        for p in range(self.partitions):
+            path = os.path.join(self.spill_dir, f"{p}.txt")
+            if os.path.exists(path):
+                yield from self._load(path).values()
+
+    def groups(self):
+        if not self.keep_members:
+            raise ValueError("members were not kept (keep_members=False), use counts()")
+        return self._all()
+
+    def counts(self):
+        for g in self._all():
+            yield (g[0], len(g)) if self.keep_members else (g[1], g[0])
+
+    def close(self):
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
+        self.groups_, self.used = {}, 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+# whitespace separated words of a text stream, read line by line
+def words(lines):
+    for line in lines:
+        yield from line.split()
+
+
+if __name__ == "__main__":
+    print(Solution().groupAnagrams(["eat","tea","tan","ate","nat","bat"]))
+
+    with AnagramGrouper(memory=1000, partitions=4) as g:  # tiny budget: spills to disk
+        g.extend(words(["eat tea tan", "ate nat bat", "tab eta"]))
+        print(sorted(sorted(grp) for grp in g.groups()), sorted(g.counts()))
@@ -59,4 +59,171 @@ Now, the frog is left with only 1 hop.
 The 4th rocks on either side have 1 and 3 flowers, respectively.
 The frog ends its last hop on the rock with 3 flowers, and the total becomes 9 + 3 = 12.
 
-Hence, the output is 12."""
\ No newline at end of file
+Hence, the output is 12."""
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The frog's move only depends on the rock it is on, so every rock has exactly
+# one next rock: nxt[i] is (i + A[i]) % N or (i - A[i]) % N, whichever has more
+# flowers. Following nxt from any rock is a "rho": a tail, then a cycle that
+# repeats forever. Once the walk gets back to a rock it has seen, the rest of
+# the T hops is whole laps of the cycle plus a partial one, so T can be huge
+# (10**18) and the work stays O(min(N, T)).
+# The total counts the rock the frog starts on plus one rock per hop: T + 1 rocks.
+
+def next_hops(A):
+    N = len(A)
+    if np is not None and N >= 1024:
+        a = np.asarray(A, dtype=np.int64)
+        i = np.arange(N, dtype=np.int64)
+        cw, acw = (i + a) % N, (i - a) % N
+        return np.where(a[cw] >= a[acw], cw, acw).tolist()
+    nxt = [0] * N
+    for i, a in enumerate(A):
+        cw, acw = (i + a) % N, (i - a) % N
+        nxt[i] = cw if A[cw] >= A[acw] else acw
+    return nxt
+
+def frogAndFlowers_brute_force(N, T, A, start=0):
+    total, i = A[start], start
+    for _ in range(T):
+        i = (i + A[i]) % N if A[(i + A[i]) % N] >= A[(i - A[i]) % N] else (i - A[i]) % N
+        total += A[i]
+    return total
+
+def frogAndFlowers(N, T, A, start=0):
+    # this is default OUTPUT. You can change it.
+    result = -404
+
+    # write your Logic here:
+    nxt = next_hops(A)
+    seen = [-1] * N     # step at which the walk first stood on each rock
+    prefix = [0]        # prefix[k] = flowers of the first k rocks of the walk
+    i = start
+    while seen[i] < 0 and len(prefix) <= T + 1:
+        seen[i] = len(prefix) - 1
+        prefix.append(prefix[-1] + A[i])
+        i = nxt[i]
+    if T + 1 < len(prefix):     # done before going round the cycle
+        return prefix[T + 1]
+    tail, length = seen[i], len(prefix) - 1 - seen[i]
+    laps, rest = divmod(T + 1 - tail, length)
+    lap = prefix[tail + length] - prefix[tail]
+    result = prefix[tail] + laps * lap + prefix[tail + rest] - prefix[tail]
+
+    return result
+
+
+# Many (T, start) queries on the same rocks, hops first like total() and
+# frogAndFlowers. The next hop graph is split once into cycles and the trees
+# hanging off them (O(N)):
+#   entry[v]  the first cycle rock the frog reaches from v
+#   depth[v]  hops from v to entry[v]            (0 on a cycle)
+#   down[v]   flowers of the depth[v] rocks from v up to entry[v], not counting it
+#   pos[v]    index of a cycle rock in its cycle; cycles[c] = prefix sums of one lap
+# A walk of m = T + 1 rocks from v that reaches the cycle takes
+# down[v] + m - depth[v] rocks of the cycle from entry[v]: O(1).
+# A walk that ends before that is down[v] - down[u] for the rock u that is m
+# hops further on; those are answered in one depth first pass over the trees
+# (the current root path is a stack, u is m entries below the top).
+class FrogWalk:
+    def __init__(self, A):
+        self.A = A
+        N = self.N = len(A)
+        nxt = self.nxt = next_hops(A)
+        entry, depth, down, pos = [-1] * N, [0] * N, [0] * N, [-1] * N
+        cyc = [-1] * N            # cycle id of cycle rocks
+        self.cycles = []
+        state = [0] * N           # 0 new, 1 on the current walk, 2 done
+        for s in range(N):
+            if state[s]:
+                continue
+            path, v = [], s
+            while not state[v]:
+                state[v] = 1
+                path.append(v)
+                v = nxt[v]
+            if state[v] == 1:     # the walk closed a new cycle at v
+                k = path.index(v)
+                sums = [0]
+                for p, u in enumerate(path[k:]):
+                    entry[u], pos[u], cyc[u], state[u] = u, p, len(self.cycles), 2
+                    sums.append(sums[-1] + A[u])
+                self.cycles.append(sums)
+                del path[k:]
+            for u in reversed(path):
+                w = nxt[u]
+                entry[u], depth[u], down[u], state[u] = entry[w], depth[w] + 1, down[w] + A[u], 2
+        self.entry, self.depth, self.down, self.pos, self.cyc = entry, depth, down, pos, cyc
+
+    # flowers of m consecutive cycle rocks starting at cycle rock v
+    def _on_cycle(self, v, m):
+        sums = self.cycles[self.cyc[v]]
+        length, p = len(sums) - 1, self.pos[v]
+        laps, rest = divmod(m, length)
+        total = laps * sums[-1]
+        if p + rest <= length:
+            return total + sums[p + rest] - sums[p]
+        return total + sums[-1] - sums[p] + sums[p + rest - length]
+
+    def total(self, T, start=0):
+        return self.totals([(T, start)])[0]
+
+    # queries: (T, start) pairs, answers in the same order
+    def totals(self, queries):
+        depth, down, entry = self.depth, self.down, self.entry
+        out = [0] * len(queries)
+        pending = {}              # rock -> [(query index, rocks walked)] ending before the cycle
+        for qi, (T, v) in enumerate(queries):
+            if not 0 <= v < self.N:
+                raise IndexError(f"start rock {v} out of range for {self.N} rocks")
+            m = T + 1
+            if m > depth[v]:
+                out[qi] = down[v] + self._on_cycle(entry[v], m - depth[v])
+            else:
+                pending.setdefault(v, []).append((qi, m))
+        if pending:
+            self._tree_queries(pending, out)
+        return out
+
+    def _tree_queries(self, pending, out):
+        N, nxt, depth, down = self.N, self.nxt, self.depth, self.down
+        # children of every rock in the trees (cycle edges left out), CSR layout
+        first = [0] * (N + 1)
+        for v in range(N):
+            if depth[v]:
+                first[nxt[v] + 1] += 1
+        for v in range(N):
+            first[v + 1] += first[v]
+        kids, fill = [0] * first[N], first[:]
+        for v in range(N):
+            if depth[v]:
+                kids[fill[nxt[v]]] = v
+                fill[nxt[v]] += 1
+        for root in range(N):
+            if depth[root] or first[root] == first[root + 1]:
+                continue
+            path, it = [root], [first[root]]
+            while path:
+                i = it[-1]
+                if i == first[path[-1] + 1]:
+                    path.pop()
+                    it.pop()
+                    continue
+                it[-1] = i + 1
+                v = kids[i]
+                path.append(v)
+                it.append(first[v])
+                for qi, m in pending.get(v, ()):
+                    out[qi] = down[v] - down[path[-1 - m]]
+
+
+if __name__ == "__main__":
+    # INPUT [uncomment & modify if required]
+    N, T = map(int, input().split())
+    A = list(map(int, input().split()))
+
+    # OUTPUT [uncomment & modify if required]
+    print(frogAndFlowers(N, T, A))
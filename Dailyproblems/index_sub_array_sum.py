@@ -1,7 +1,10 @@
+from array import array
+from bisect import bisect_left
 class Solution: # https://www.geeksforgeeks.org/problems/subarray-with-given-sum-1587115621/1?page=1&sortBy=submissions
     def subarraySum(self, arr, target):
         
         i,j=0,1
+        arr = arr[:]  # prefix sums on a copy, leave the caller's list alone
         for k in range(1,len(arr)):
            arr[k] = arr[k-1] + arr[k]
         if target in arr:
@@ -23,7 +26,7 @@ class Solution: # https://www.geeksforgeeks.org/problems/subarray-with-given-sum
         for k in range(1,l):
             pa[k] = pa[k-1]+arr[k]
         i,j=0,1
-        if target in pa: return [1,pa.index[target]+1]
+        if target in pa: return [1,pa.index(target)+1]
         while j < l:
             csum = pa[j] - pa[i]
             if csum == target: return [i+2,j+1]
@@ -38,10 +41,81 @@ class Solution: # https://www.geeksforgeeks.org/problems/subarray-with-given-sum
             if ps-target in hm: return [hm[ps-target]+1,i+1]
             hm[ps] = i+1
         return [-1]
-            
 
 
-        
+# Build the prefix sums once, then answer any number of queries on them.
+# prefix[j] = arr[0] + ... + arr[j-1] (prefix[0] = 0), so
+#   sum(arr[i..j-1]) = prefix[j] - prefix[i]
+# and a subarray sums to k  <=>  prefix[i] = prefix[j] - k for some i < j.
+# pos maps every prefix value to where it occurs (an int, or a sorted list
+# when the value repeats), so a query is one dict lookup + bisect per j,
+# nothing is rebuilt. Positions are 1-based [l, r] like the methods above.
+class PrefixSumIndex:
+    def __init__(self, arr=()):
+        self.prefix = array('q', [0])  # becomes a list if values are not int64
+        self.pos = {0: 0}
+        self._counts = {}  # target -> count, cleared on append
+        self.extend(arr)
+
+    def __len__(self):
+        return len(self.prefix) - 1
+
+    def append(self, x):
+        p = self.prefix[-1] + x
+        try:
+            self.prefix.append(p)
+        except (TypeError, OverflowError):  # floats / huge ints
+            self.prefix = list(self.prefix)
+            self.prefix.append(p)
+        j = len(self.prefix) - 1
+        old = self.pos.get(p)
+        if old is None: self.pos[p] = j
+        elif isinstance(old, int): self.pos[p] = [old, j]
+        else: old.append(j)
+        self._counts.clear()
+
+    def extend(self, arr):
+        for x in arr:
+            self.append(x)
+
+    def _positions(self, v):
+        p = self.pos.get(v)
+        if p is None: return ()
+        return (p,) if isinstance(p, int) else p
+
+    # sum of arr[l..r], 1-based inclusive, O(1)
+    def range_sum(self, l, r):
+        return self.prefix[r] - self.prefix[l - 1]
+
+    # first subarray (smallest r, then the shortest) summing to k, or [-1]
+    def find(self, k):
+        prefix = self.prefix
+        for j in range(1, len(prefix)):
+            ps = self._positions(prefix[j] - k)
+            i = bisect_left(ps, j)
+            if i: return [ps[i - 1] + 1, j]
+        return [-1]
+
+    # every [l, r] with sum k, ordered by r
+    def find_all(self, k):
+        res, prefix = [], self.prefix
+        for j in range(1, len(prefix)):
+            ps = self._positions(prefix[j] - k)
+            for t in range(bisect_left(ps, j)):
+                res.append([ps[t] + 1, j])
+        return res
+
+    # number of subarrays summing to k
+    def count(self, k):
+        if k not in self._counts:
+            prefix, c = self.prefix, 0
+            for j in range(1, len(prefix)):
+                ps = self._positions(prefix[j] - k)
+                if ps: c += bisect_left(ps, j)
+            self._counts[k] = c
+        return self._counts[k]
+
+
 
 
 
@@ -49,4 +123,9 @@ class Solution: # https://www.geeksforgeeks.org/problems/subarray-with-given-sum
 
 sol = Solution()
 tup = ([1, 2, 3, 7, 5],12)
-print(sol.sumhashmap(*tup))
\ No newline at end of file
+print(sol.sumhashmap(*tup))
+
+idx = PrefixSumIndex([1, 2, 3, 7, 5])
+print(idx.find(12), idx.find_all(12), idx.count(12), idx.range_sum(2, 4))
+idx.append(-5)
+print(idx.find_all(12), idx.count(0))
@@ -38,29 +38,218 @@ def findMinLoss_brute_force(N, A): # same as above method without lru_cache
     
     return dfs(0, N - 1, 1)
 
-def findMinLoss_hashmap(N, A):
-    memo = {}  # Hash map for memoization
+def findMinLoss_hashmap(N, A, memo=None):
+    # memo: {} by default, or a bounded cache (Utilities/cache.py LRUCache /
+    # LFUCache) to cap memory; below ~N*N/2 entries evicted intervals get
+    # computed again. Keys are left << 32 | right: one int, no tuple per lookup.
+    memo = {} if memo is None else memo  # Hash map for memoization
 
     def dp(left, right):
         if left > right:
             return 0 
-        if (left, right) in memo:
-            return memo[(left, right)] 
+        key = (left << 32) | right
+        res = memo.get(key)
+        if res is not None:
+            return res
         
         days = N - (right - left)
         
         # Base case: Only one drink left
         if left == right:
-            memo[(left, right)] = days * A[left]
-            return memo[(left, right)]
-        memo[(left, right)] = min(
-            days * A[left] + dp(left + 1, right), 
-            days * A[right] + dp(left, right - 1)
-        )
-        return memo[(left, right)]
+            res = days * A[left]
+        else:
+            res = min(
+                days * A[left] + dp(left + 1, right), 
+                days * A[right] + dp(left, right - 1)
+            )
+        memo[key] = res
+        return res
 
     return dp(0, N - 1)
 
+
+# --- O(N) memory interval dp -------------------------------------------------
+# dp[i][j] above only reads dp[i+1][j] and dp[i][j-1], the diagonal of
+# intervals one shorter. So only one diagonal is kept: a 1-D buffer where
+# buf[i] is the answer for the interval of the current length starting at i,
+# overwritten in place. O(N^2) time, O(N) memory; with numpy every diagonal is
+# one vectorized step.
+#
+# Seen as a path: state (a, b) = a drinks sold from the left, b from the
+# right, day a+b+1 sells either drink a or drink N-1-b. The interval table is
+# the cost to go from (a, b) to the end; sell_order() uses that, plus the cost
+# to reach (a, b) from the start, to find the best state halfway through
+# (Hirschberg's trick) and recurses on both halves -> the full sell order
+# with O(N) memory and about twice the work of the min alone.
+#
+# cost(i, k): loss of selling drink i on day k (1 based), default k * A[i].
+# vectorized=True: cost is called with numpy index arrays (the default cost
+# is vectorized automatically when numpy is there and the numbers fit, see
+# _np_dtype).
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BIG = 1 << 62  # "no state" for int64, stays far below overflow after adding a cost
+
+# numpy dtype the dp runs in exactly, None: pure python (exact for any ints).
+# int prices: int64 while the worst possible total, max|A| * (1 + ... + n),
+# stays below BIG / 2; float prices: float64 (ints mixed in must be exact
+# floats, below 2**53).
+def _np_dtype(A, n):
+    if np is None or n == 0:
+        return None
+    try:
+        x = np.asarray(A)
+    except (ValueError, OverflowError):
+        return None
+    if x.dtype.kind in 'iu':
+        worst = max(abs(int(x.max())), abs(int(x.min()))) * n * (n + 1) // 2
+        return np.dtype(np.int64) if worst < BIG // 2 else None
+    if x.dtype.kind == 'f':
+        if isinstance(A, np.ndarray) or all(type(v) is float or -2 ** 53 < v < 2 ** 53 for v in A):
+            return np.dtype(np.float64)
+    return None
+
+# a vectorized user cost: float64 if it returns floats, else int64 (its
+# totals are the caller's to keep in range)
+def _cost_dtype(cost, n):
+    kind = np.asarray(cost(np.arange(n), n)).dtype.kind
+    return np.dtype(np.float64) if kind == 'f' else np.dtype(np.int64)
+
+# pure python compares any ints / floats with inf, so only int64 needs BIG
+def _big(dtype):
+    if dtype is None or dtype.kind == 'f':
+        return float('inf')
+    return BIG
+
+def _default_cost(A, dtype):
+    if dtype is not None:
+        arr = np.asarray(A, dtype=dtype)
+        return lambda i, k: arr[i] * k
+    return lambda i, k: k * A[i]
+
+# states on diagonal d (a + b = d) inside the rectangle [a0, a1] x [b0, b1]
+def _span(d, a0, b0, a1, b1):
+    return max(a0, d - b1), min(a1, d - b0)
+
+# one step along the diagonals. vals holds the states a = lo..hi of the
+# diagonal already known; returns the values for a = nlo..nhi of the next one.
+# forward:  (a-1, b) or (a, b-1) on diagonal d  -> (a, b) on d+1, day d+1
+# backward: (a+1, b) or (a, b+1) on diagonal d+1 -> (a, b) on d, day d+1
+def _step(vals, lo, hi, nlo, nhi, d, n, cost, dtype, forward):
+    day = d + 1
+    big = _big(dtype)
+    if dtype is not None:
+        a = np.arange(nlo, nhi + 1)
+        padded = np.concatenate((np.array([big], dtype), vals, np.array([big], dtype)))  # a = lo-1 .. hi+1
+        right_item = np.clip(n - 1 - (d - a), 0, n - 1)
+        if forward:
+            left = padded[a - lo] + cost(np.clip(a - 1, 0, n - 1), day)
+        else:
+            left = padded[a - lo + 2] + cost(a, day)
+        right = padded[a - lo + 1] + cost(right_item, day)
+        return np.minimum(np.minimum(left, right), big)
+    out = []
+    for a in range(nlo, nhi + 1):
+        best = big
+        src = a - 1 if forward else a + 1   # neighbour reached by a left sale
+        if lo <= src <= hi:
+            best = vals[src - lo] + cost(a - 1 if forward else a, day)
+        if lo <= a <= hi:
+            best = min(best, vals[a - lo] + cost(n - 1 - (d - a), day))
+        out.append(best)
+    return out
+
+# (dtype, cost) for the public wrappers
+def _setup(N, A, cost, vectorized):
+    if cost is None:
+        dtype = _np_dtype(A, N)
+        return dtype, _default_cost(A, dtype)
+    return (_cost_dtype(cost, N) if vectorized and np is not None and N else None), cost
+
+def _scalar(v):
+    return v.item() if hasattr(v, 'item') else v
+
+# minimum total cost of selling n drinks from the ends, O(n) memory.
+# buf[a] = best cost from state (a, d - a) to the end, for the current d;
+# the last diagonal (everything sold) costs 0. Updated in place for a going
+# up: buf[a] reads the old buf[a] and buf[a+1] (not yet overwritten).
+# dtype: numpy dtype to run vectorized in, None for pure python.
+def interval_dp_min(n, cost, dtype=None):
+    if dtype is not None:
+        buf = np.zeros(n + 1, dtype=dtype)
+        idx = np.arange(n)
+        for d in range(n - 1, -1, -1):
+            day = d + 1
+            np.minimum(buf[1:d + 2] + cost(idx[:d + 1], day),      # sell drink a
+                       buf[:d + 1] + cost(idx[n - 1 - d:], day),   # sell drink n-1-b
+                       out=buf[:d + 1])
+        return _scalar(buf[0])
+    buf = [0] * (n + 1)
+    for d in range(n - 1, -1, -1):
+        day, off = d + 1, n - 1 - d
+        for a in range(d + 1):
+            buf[a] = min(buf[a + 1] + cost(a, day), buf[a] + cost(off + a, day))
+    return buf[0]
+
+def _forward_to(d_end, a0, b0, a1, b1, n, cost, dtype):
+    vals = np.zeros(1, dtype=dtype) if dtype is not None else [0]
+    lo = hi = a0
+    for d in range(a0 + b0, d_end):
+        nlo, nhi = _span(d + 1, a0, b0, a1, b1)
+        vals, lo, hi = _step(vals, lo, hi, nlo, nhi, d, n, cost, dtype, True), nlo, nhi
+    return vals, lo
+
+def _backward_to(d_end, a0, b0, a1, b1, n, cost, dtype):
+    vals = np.zeros(1, dtype=dtype) if dtype is not None else [0]
+    lo = hi = a1
+    for d in range(a1 + b1 - 1, d_end - 1, -1):
+        nlo, nhi = _span(d, a0, b0, a1, b1)
+        vals, lo, hi = _step(vals, lo, hi, nlo, nhi, d, n, cost, dtype, False), nlo, nhi
+    return vals, lo
+
+# appends the drinks sold on the best path (a0, b0) -> (a1, b1)
+def _path(a0, b0, a1, b1, n, cost, dtype, out):
+    if a0 == a1:
+        out.extend(n - 1 - b for b in range(b0, b1))
+        return
+    if b0 == b1:
+        out.extend(range(a0, a1))
+        return
+    mid = (a0 + b0 + a1 + b1) // 2
+    g, lo = _forward_to(mid, a0, b0, a1, b1, n, cost, dtype)
+    f, _ = _backward_to(mid, a0, b0, a1, b1, n, cost, dtype)
+    total = [x + y for x, y in zip(g, f)]
+    a = lo + total.index(min(total))
+    _path(a0, b0, a, mid - a, n, cost, dtype, out)
+    _path(a, mid - a, a1, b1, n, cost, dtype, out)
+
+# (min total cost, drinks in the order they are sold)
+def interval_dp_plan(n, cost, dtype=None):
+    if n == 0:
+        return 0, []
+    # the final state (a, n - a) is not fixed: a forward pass over the whole
+    # triangle gives the cost of every way to finish, take the best one
+    g, _ = _forward_to(n, 0, 0, n, n, n, cost, dtype)
+    g = list(g)
+    best = min(g)
+    a_end = g.index(best)
+    order = []
+    _path(0, 0, a_end, n - a_end, n, cost, dtype, order)
+    return _scalar(best), order
+
+def findMinLoss_rolling(N, A, cost=None, vectorized=False):
+    dtype, cost = _setup(N, A, cost, vectorized)
+    return interval_dp_min(N, cost, dtype)
+
+# (min loss, indexes of the drinks in the order they are sold)
+def sell_order(N, A, cost=None, vectorized=False):
+    dtype, cost = _setup(N, A, cost, vectorized)
+    return interval_dp_plan(N, cost, dtype)
+
 # Sample Input
 N = 3
 A = [10, 20, 30]
@@ -68,6 +257,11 @@ print("iterative: ",findMinLoss_iterative(N, A))
 print("lrucache: ",find_min_loss(A, N))
 print("hashmap: ",findMinLoss_hashmap(N, A))
 print("bruteforce : ",findMinLoss_brute_force(N, A)) 
+print("rolling: ",findMinLoss_rolling(N, A), sell_order(N, A))
+# float prices and totals past int64 leave the int64 numpy path
+assert findMinLoss_rolling(3, [1.5, 2.5, 0.5]) == findMinLoss_iterative(3, [1.5, 2.5, 0.5]) == 8.0
+assert sell_order(3, [1.5, 2.5, 0.5])[0] == 8.0
+assert findMinLoss_rolling(300, [10 ** 18] * 300) == findMinLoss_iterative(300, [10 ** 18] * 300)
 
 
 # if __name__ == "__main__":
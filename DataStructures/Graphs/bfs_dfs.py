@@ -1,7 +1,13 @@
 from collections import deque
+from csr_graph import CSRGraph, bfs_csr, dfs_csr
+
+# adj can be a list[list[int]] built with addEdge or a CSRGraph,
+# both give the same visit order
 def bfs(adj):
+    if isinstance(adj, CSRGraph):
+        return bfs_csr(adj)
     src, V, res= 0, len(adj), []
-    q = deque(src)
+    q = deque([src])
     visited = [False] * V
     visited[src] = True
     while q:
@@ -13,9 +19,11 @@ def bfs(adj):
                 visited[i] = True
                 q.append(i)
                 
-    print(res)
+    return res
 
 def dfs(adj):
+    if isinstance(adj, CSRGraph):
+        return dfs_csr(adj)
     src, V, res= 0, len(adj), []
     stk = [src]
     visited = [False] * V
@@ -29,7 +37,7 @@ def dfs(adj):
         for i in reversed(adj[curr]):
             if not visited[i]:
                 stk.append(i)
-    print(res)
+    return res
 
 def dfsrec(adj, node, visited, res):
     visited[node] = True
@@ -56,7 +64,11 @@ if __name__ == "__main__":
     addEdge(adj, 2, 0)
     addEdge(adj, 0, 3)
     addEdge(adj, 5, 4)
-    dfs(adj)
+    print(bfs(adj), dfs(adj))
+
+    # same graph in CSR form, built in bulk from edge arrays
+    g = CSRGraph.from_edges(V, [1, 2, 0, 5], [2, 0, 3, 4])
+    print(bfs(g), dfs(g), dfsrec(g, 0, [False] * V, []))
 
     # Printing the adjacency list
     for i in range(V):
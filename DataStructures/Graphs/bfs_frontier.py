@@ -0,0 +1,192 @@
+from array import array
+from csr_graph import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:  # falls back to the pure python frontier loops
+    np = None
+
+# Level synchronous BFS: the whole frontier (all vertices at distance d) is
+# expanded at once to build the frontier at distance d+1.
+# Returns (dist, parent) arrays, -1 marks unreachable vertices / the source's parent.
+# With numpy every level is a handful of gather/mask operations over the CSR arrays.
+
+def _as_csr(adj):
+    return adj if isinstance(adj, CSRGraph) else CSRGraph.from_adj(adj)
+
+def bfs_levels(adj, src=0):
+    g = _as_csr(adj)
+    if np is not None:
+        return _bfs_levels_np(g, src)
+    return _bfs_levels_py(g, src)
+
+# Direction optimizing BFS (Beamer et al.): top-down while the frontier is small,
+# bottom-up (every unvisited vertex looks for a parent in the frontier) once
+# the frontier's edges outnumber the unvisited edges / alpha; back to top-down
+# when the frontier shrinks below V / beta.
+# reverse: the graph with every edge reversed, the bottom-up steps walk it.
+# Left out it is built with transpose() (O(V+E)), which is always correct;
+# an undirected (addEdge) graph is its own reverse, pass reverse=adj to skip that.
+def bfs_direction_optimizing(adj, src=0, reverse=None, alpha=14, beta=24):
+    g = _as_csr(adj)
+    if reverse is None:
+        rg = g.transpose()
+    elif reverse is adj:
+        rg = g
+    else:
+        rg = _as_csr(reverse)
+    if np is not None:
+        return _bfs_do_np(g, rg, src, alpha, beta)
+    return _bfs_do_py(g, rg, src, alpha, beta)
+
+
+# ---------- pure python ----------
+def _top_down_py(offsets, targets, frontier, dist, parent, level):
+    nxt = []
+    for u in frontier:
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if dist[v] < 0:
+                dist[v] = level
+                parent[v] = u
+                nxt.append(v)
+    return nxt
+
+def _bottom_up_py(roffsets, rtargets, V, dist, parent, level):
+    nxt = []
+    for v in range(V):
+        if dist[v] >= 0:
+            continue
+        for k in range(roffsets[v], roffsets[v + 1]):
+            u = rtargets[k]
+            if dist[u] == level - 1:  # u is in the current frontier
+                dist[v] = level
+                parent[v] = u
+                nxt.append(v)
+                break
+    return nxt
+
+def _bfs_levels_py(g, src):
+    dist = array('i', [-1]) * g.V
+    parent = array('i', [-1]) * g.V
+    dist[src] = 0
+    frontier, level = [src], 0
+    while frontier:
+        level += 1
+        frontier = _top_down_py(g.offsets, g.targets, frontier, dist, parent, level)
+    return dist, parent
+
+def _bfs_do_py(g, rg, src, alpha, beta):
+    offsets, V = g.offsets, g.V
+    dist = array('i', [-1]) * V
+    parent = array('i', [-1]) * V
+    dist[src] = 0
+    frontier, level = [src], 0
+    m_u = len(g.targets) - g.degree(src)  # edges still to be checked
+    bottom_up = False
+    while frontier:
+        m_f = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and m_f > m_u / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < V / beta:
+            bottom_up = False
+        level += 1
+        if bottom_up:
+            frontier = _bottom_up_py(rg.offsets, rg.targets, V, dist, parent, level)
+        else:
+            frontier = _top_down_py(offsets, g.targets, frontier, dist, parent, level)
+        m_u -= sum(offsets[u + 1] - offsets[u] for u in frontier)
+    return dist, parent
+
+
+# ---------- numpy ----------
+def _np_csr(g):
+    return np.frombuffer(g.offsets, dtype=np.intc), np.frombuffer(g.targets, dtype=np.intc)
+
+# all edges leaving the vertices in `nodes`: (edge source, edge target) arrays
+def _gather_np(offsets, targets, nodes):
+    starts = offsets[nodes]
+    deg = offsets[nodes + 1] - starts
+    total = int(deg.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.intc)
+        return empty, empty
+    # edge index = start of its segment + position inside the segment
+    idx = np.arange(total) + np.repeat(starts - (np.cumsum(deg) - deg), deg)
+    return np.repeat(nodes, deg), targets[idx]
+
+def _top_down_np(offsets, targets, frontier, dist, parent, level):
+    srcs, nbrs = _gather_np(offsets, targets, frontier)
+    new = dist[nbrs] < 0
+    srcs, nbrs = srcs[new], nbrs[new]
+    nbrs, first = np.unique(nbrs, return_index=True)
+    # keep discovery order so parents match the queue based bfs
+    order = np.argsort(first, kind='stable')
+    nbrs, first = nbrs[order], first[order]
+    dist[nbrs] = level
+    parent[nbrs] = srcs[first]
+    return nbrs
+
+def _bottom_up_np(roffsets, rtargets, dist, parent, level):
+    unvisited = np.flatnonzero(dist < 0).astype(np.intc)
+    segs, nbrs = _gather_np(roffsets, rtargets, unvisited)
+    hit = dist[nbrs] == level - 1
+    segs, nbrs = segs[hit], nbrs[hit]
+    # first frontier neighbour of every vertex becomes its parent
+    found, first = np.unique(segs, return_index=True)
+    dist[found] = level
+    parent[found] = nbrs[first]
+    return found
+
+def _bfs_levels_np(g, src):
+    offsets, targets = _np_csr(g)
+    dist = np.full(g.V, -1, dtype=np.intc)
+    parent = np.full(g.V, -1, dtype=np.intc)
+    dist[src] = 0
+    frontier, level = np.array([src], dtype=np.intc), 0
+    while frontier.size:
+        level += 1
+        frontier = _top_down_np(offsets, targets, frontier, dist, parent, level)
+    return dist, parent
+
+def _bfs_do_np(g, rg, src, alpha, beta):
+    offsets, targets = _np_csr(g)
+    roffsets, rtargets = _np_csr(rg)
+    degree = np.diff(offsets)
+    dist = np.full(g.V, -1, dtype=np.intc)
+    parent = np.full(g.V, -1, dtype=np.intc)
+    dist[src] = 0
+    frontier, level = np.array([src], dtype=np.intc), 0
+    m_u = int(degree.sum()) - int(degree[src])
+    bottom_up = False
+    while frontier.size:
+        m_f = int(degree[frontier].sum())
+        if not bottom_up and m_f > m_u / alpha:
+            bottom_up = True
+        elif bottom_up and frontier.size < g.V / beta:
+            bottom_up = False
+        level += 1
+        if bottom_up:
+            frontier = _bottom_up_np(roffsets, rtargets, dist, parent, level)
+        else:
+            frontier = _top_down_np(offsets, targets, frontier, dist, parent, level)
+        m_u -= int(degree[frontier].sum())
+    return dist, parent
+
+# walk the parent array back from dst, [] if dst is unreachable
+def shortest_path(parent, src, dst):
+    if dst != src and parent[dst] < 0:
+        return []
+    path = [dst]
+    while path[-1] != src:
+        path.append(int(parent[path[-1]]))
+    return path[::-1]
+
+
+if __name__ == "__main__":
+    g = CSRGraph.from_edges(6, [1, 2, 0, 5, 3], [2, 0, 3, 4, 1])
+    dist, parent = bfs_levels(g, 0)
+    print(dist.tolist(), parent.tolist())
+    dist, parent = bfs_direction_optimizing(g, 0, reverse=g)  # undirected: its own reverse
+    print(dist.tolist(), parent.tolist())
+    print(shortest_path(parent, 0, 1))
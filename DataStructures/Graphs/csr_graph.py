@@ -0,0 +1,178 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # builders fall back to pure python counting sort
+    np = None
+
+# Compressed Sparse Row (CSR) graph
+# offsets[u] .. offsets[u+1] is the slice of targets holding the neighbours of u
+# two flat int arrays instead of one python list per vertex -> ~8 bytes per edge
+# neighbour order is the same as the edge order given to the builder,
+# so bfs/dfs over a CSRGraph visit vertices in the same order as over adj lists
+
+# optional edge weights live in a third array parallel to targets:
+# array('q') when every weight is an int, array('d') otherwise
+def _weight_array(weights):
+    if np is not None and isinstance(weights, np.ndarray):
+        if weights.dtype.kind in 'iub':
+            return array('q', weights.astype(np.int64).tobytes())
+        return array('d', weights.astype(np.float64).tobytes())
+    if isinstance(weights, array) and weights.typecode in 'qd':
+        return weights
+    return array('q' if all(isinstance(w, int) for w in weights) else 'd', weights)
+
+class CSRGraph:
+    def __init__(self, offsets, targets, weights=None):
+        self.offsets = offsets  # array('i') of size V+1
+        self.targets = targets  # array('i') of size E
+        self.weights = weights  # None or array('q'/'d') of size E
+        self.V = len(offsets) - 1
+        self._view = memoryview(targets)
+
+    # graph[u] gives the neighbours of u as a zero-copy memoryview,
+    # so code written for adj lists (adj[u], len(adj)) works unchanged
+    def __getitem__(self, u):
+        return self._view[self.offsets[u]:self.offsets[u + 1]]
+
+    def __len__(self):
+        return self.V
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    # bulk builder: one counting sort over the edge arrays, O(V + E)
+    # src/dst (and weights) can be lists, array('i') or any int sequence
+    @classmethod
+    def from_edges(cls, V, src, dst, directed=False, weights=None):
+        if len(src) != len(dst) or (weights is not None and len(weights) != len(src)):
+            raise ValueError("src, dst and weights must have the same length")
+        if weights is not None:
+            weights = _weight_array(weights)
+        if np is not None:
+            return cls._from_edges_np(V, src, dst, directed, weights)
+        offsets = array('i', [0]) * (V + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        if not directed:
+            for v in dst:
+                offsets[v + 1] += 1
+        for i in range(V):
+            offsets[i + 1] += offsets[i]
+
+        targets = array('i', [0]) * offsets[V]
+        wts = None if weights is None else array(weights.typecode, [0]) * offsets[V]
+        pos = offsets[:-1]  # next free slot of every vertex
+        for e, (u, v) in enumerate(zip(src, dst)):
+            targets[pos[u]] = v
+            if wts is not None:
+                wts[pos[u]] = weights[e]
+            pos[u] += 1
+            if not directed:
+                # same order as addEdge: u gets v, then v gets u
+                targets[pos[v]] = u
+                if wts is not None:
+                    wts[pos[v]] = weights[e]
+                pos[v] += 1
+        return cls(offsets, targets, wts)
+
+    # numpy version of the counting sort above: a stable argsort on the
+    # source vertex keeps every vertex's neighbours in edge order
+    @classmethod
+    def _from_edges_np(cls, V, src, dst, directed, weights=None):
+        src = np.asarray(src, dtype=np.intc)
+        dst = np.asarray(dst, dtype=np.intc)
+        if weights is not None:
+            w = np.frombuffer(weights, dtype=np.int64 if weights.typecode == 'q' else np.float64)
+        if not directed:
+            # interleave u->v and v->u so the order matches addEdge
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            if weights is not None:
+                w = np.repeat(w, 2)
+        order = np.argsort(src, kind='stable')
+        offsets = np.zeros(V + 1, dtype=np.intc)
+        np.cumsum(np.bincount(src, minlength=V), out=offsets[1:])
+        wts = None if weights is None else array(weights.typecode, w[order].tobytes())
+        return cls(array('i', offsets.tobytes()), array('i', dst[order].tobytes()), wts)
+
+    # convert an existing adjacency list (list[list[int]]) built with addEdge,
+    # entries can also be (v, weight) pairs for a weighted graph
+    @classmethod
+    def from_adj(cls, adj):
+        offsets = array('i', [0]) * (len(adj) + 1)
+        for u, nbrs in enumerate(adj):
+            offsets[u + 1] = offsets[u] + len(nbrs)
+        weighted = any(nbrs and isinstance(nbrs[0], tuple) for nbrs in adj)
+        targets, weights = array('i'), []
+        for nbrs in adj:
+            if weighted:
+                for v, w in nbrs:
+                    targets.append(v)
+                    weights.append(w)
+            else:
+                targets.extend(nbrs)
+        return cls(offsets, targets, _weight_array(weights) if weighted else None)
+
+    def to_adj(self):
+        if self.weights is not None:
+            return [[(self.targets[k], self.weights[k]) for k in range(self.offsets[u], self.offsets[u + 1])]
+                    for u in range(self.V)]
+        return [list(self[u]) for u in range(self.V)]
+
+    # reversed edges (u->v becomes v->u), built as CSR arrays directly
+    def transpose(self):
+        offsets, targets = self.offsets, self.targets
+        if np is not None:
+            src = np.repeat(np.arange(self.V, dtype=np.intc), np.diff(np.frombuffer(offsets, dtype=np.intc)))
+            return CSRGraph.from_edges(self.V, np.frombuffer(targets, dtype=np.intc), src, directed=True, weights=self.weights)
+        src = array('i', [0]) * len(targets)
+        for u in range(self.V):
+            for k in range(offsets[u], offsets[u + 1]):
+                src[k] = u
+        return CSRGraph.from_edges(self.V, targets, src, directed=True, weights=self.weights)
+
+
+# traversals working directly on the flat arrays (no per-vertex objects)
+def bfs_csr(g, src=0):
+    offsets, targets = g.offsets, g.targets
+    visited = bytearray(g.V)
+    visited[src] = 1
+    res = [src]
+    i = 0
+    while i < len(res):  # res doubles as the queue
+        curr = res[i]
+        i += 1
+        for k in range(offsets[curr], offsets[curr + 1]):
+            v = targets[k]
+            if not visited[v]:
+                visited[v] = 1
+                res.append(v)
+    return res
+
+def dfs_csr(g, src=0):
+    offsets, targets = g.offsets, g.targets
+    visited = bytearray(g.V)
+    res = []
+    stk = [src]
+    while stk:
+        curr = stk.pop()
+        if not visited[curr]:
+            visited[curr] = 1
+            res.append(curr)
+        for k in range(offsets[curr + 1] - 1, offsets[curr] - 1, -1):
+            v = targets[k]
+            if not visited[v]:
+                stk.append(v)
+    return res
+
+
+if __name__ == "__main__":
+    # same graph as bfs_dfs.py
+    g = CSRGraph.from_edges(6, [1, 2, 0, 5], [2, 0, 3, 4])
+    print(g.offsets, g.targets)
+    print(bfs_csr(g), dfs_csr(g))
+    for i in range(len(g)):
+        print(f"{i}: {list(g[i])}")
@@ -0,0 +1,231 @@
+import importlib.util
+import os
+import sys
+from array import array
+from csr_graph import CSRGraph
+from bfs_frontier import shortest_path as path_from_parents
+
+# the heaps live next to the other heap code in DataStructures/Tree. The file
+# is loaded by path (as Utilities/benchmark.py loads scripts) and registered
+# as 'min_heap', so importers' sys.path is left alone and one copy is shared.
+def _load_min_heap():
+    mod = sys.modules.get('min_heap')
+    if mod is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Tree', 'min_heap.py')
+        spec = importlib.util.spec_from_file_location('min_heap', path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules['min_heap'] = mod
+        spec.loader.exec_module(mod)
+    return mod
+
+_heaps = _load_min_heap()
+IndexedMinHeap, PairingHeap, RadixHeap = _heaps.IndexedMinHeap, _heaps.PairingHeap, _heaps.RadixHeap
+
+# Weighted shortest paths over the adjacency lists built with addWeightedEdge
+# (adj[u] holds (v, w) pairs, plain ints from addEdge count as weight 1) or
+# over a CSRGraph with weights. The graph is turned into CSR once and every
+# algorithm runs over the flat offsets / targets / weights arrays.
+#
+# heap= picks the priority queue, all of them support push_or_decrease/pop:
+#   'binary'  indexed binary heap, O(logn) decrease key
+#   'pairing' pairing heap, O(1) push / decrease key
+#   'radix'   radix heap, only for non negative int weights (monotone keys)
+HEAPS = {'binary': IndexedMinHeap, 'pairing': PairingHeap, 'radix': RadixHeap}
+
+INF = float('inf')
+
+def addWeightedEdge(adj, u, v, w):
+    adj[u].append((v, w))
+    adj[v].append((u, w))
+
+def _as_weighted_csr(adj):
+    g = adj if isinstance(adj, CSRGraph) else CSRGraph.from_adj(adj)
+    if g.weights is None:
+        g = CSRGraph(g.offsets, g.targets, array('q', [1]) * len(g.targets))
+    return g
+
+def _new_heap(heap, g):
+    if heap not in HEAPS:
+        raise ValueError(f"unknown heap {heap!r}, choose from {sorted(HEAPS)}")
+    if heap == 'radix' and g.weights.typecode != 'q':
+        raise ValueError("the radix heap needs int weights")
+    return HEAPS[heap](g.V)
+
+# core loop shared by dijkstra / multi source / A*:
+# dist and parent are filled in place, pq already holds the sources,
+# h(v) is the A* heuristic (None for plain dijkstra)
+def _run(g, pq, dist, parent, target=None, h=None):
+    offsets, targets, weights = g.offsets, g.targets, g.weights
+    done = bytearray(g.V)
+    while pq:
+        _, u = pq.pop()
+        if u == target:
+            return
+        done[u] = 1
+        du = dist[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = du + weights[k]
+            if nd < dist[v] and not done[v]:
+                dist[v] = nd
+                parent[v] = u
+                pq.push_or_decrease(nd if h is None else nd + h(v), v)
+
+# single source, returns (dist, parent); stops early once target is settled
+def dijkstra(adj, src, target=None, heap='binary'):
+    g = _as_weighted_csr(adj)
+    dist = [INF] * g.V
+    parent = array('i', [-1]) * g.V
+    pq = _new_heap(heap, g)
+    dist[src] = 0
+    pq.push(0, src)
+    _run(g, pq, dist, parent, target)
+    return dist, parent
+
+# A*: h(v) must never overestimate the distance from v to dst and must be
+# consistent (h(u) <= w(u,v) + h(v)), e.g. straight line distance on a map.
+# With heap='radix' h must return ints too (round a float heuristic down).
+# Returns (distance, path), (inf, []) when dst is unreachable.
+def astar(adj, src, dst, h, heap='binary'):
+    g = _as_weighted_csr(adj)
+    if heap == 'radix':
+        h = _int_heuristic(h)
+    dist = [INF] * g.V
+    parent = array('i', [-1]) * g.V
+    pq = _new_heap(heap, g)
+    dist[src] = 0
+    pq.push(h(src), src)
+    _run(g, pq, dist, parent, dst, h)
+    return dist[dst], path_from_parents(parent, src, dst)
+
+def _int_heuristic(h):
+    def checked(v):
+        x = h(v)
+        if not isinstance(x, int):
+            raise TypeError(f"heap='radix' needs an int A* heuristic, h({v}) returned {x!r}")
+        return x
+    return checked
+
+# Bidirectional dijkstra: one search forward from src, one backward from dst
+# over the reversed graph, stop once the two frontiers' minimums add up to the
+# best meeting point found so far. reverse defaults to g.transpose() (like
+# bfs_direction_optimizing); an undirected graph can pass reverse=adj.
+def bidirectional_dijkstra(adj, src, dst, reverse=None, heap='binary'):
+    g = _as_weighted_csr(adj)
+    if reverse is None:
+        rg = g.transpose()
+    elif reverse is adj:
+        rg = g
+    else:
+        rg = _as_weighted_csr(reverse)
+    if src == dst:
+        return 0, [src]
+    graphs = (g, rg)
+    dist = ([INF] * g.V, [INF] * g.V)
+    parent = (array('i', [-1]) * g.V, array('i', [-1]) * g.V)
+    done = (bytearray(g.V), bytearray(g.V))
+    pqs = (_new_heap(heap, g), _new_heap(heap, g))
+    dist[0][src] = dist[1][dst] = 0
+    pqs[0].push(0, src)
+    pqs[1].push(0, dst)
+    best, meet = INF, -1
+    while pqs[0] and pqs[1]:
+        if pqs[0].peek()[0] + pqs[1].peek()[0] >= best:
+            break
+        # expand the side with the smaller frontier
+        side = 0 if len(pqs[0]) <= len(pqs[1]) else 1
+        d, other = dist[side], dist[1 - side]
+        du, u = pqs[side].pop()
+        done[side][u] = 1
+        gs = graphs[side]
+        for k in range(gs.offsets[u], gs.offsets[u + 1]):
+            v = gs.targets[k]
+            nd = du + gs.weights[k]
+            if nd < d[v] and not done[side][v]:
+                d[v] = nd
+                parent[side][v] = u
+                pqs[side].push_or_decrease(nd, v)
+            if nd + other[v] < best:
+                best, meet = nd + other[v], v
+    if meet < 0:
+        return INF, []
+    path = path_from_parents(parent[0], src, meet)
+    back = path_from_parents(parent[1], dst, meet)
+    return best, path + back[::-1][1:]
+
+# Many sources at once: every vertex gets the distance to its nearest source
+# and which source that is, returns (dist, origin)
+def multi_source_dijkstra(adj, sources, heap='binary'):
+    g = _as_weighted_csr(adj)
+    dist = [INF] * g.V
+    parent = array('i', [-1]) * g.V
+    pq = _new_heap(heap, g)
+    for s in sources:
+        if dist[s]:
+            dist[s] = 0
+            pq.push(0, s)
+    _run(g, pq, dist, parent)
+    origin = array('i', [-1]) * g.V
+    for v in range(g.V):  # follow parents up to the source, memoized via origin
+        stk = []
+        u = v
+        while origin[u] < 0 and parent[u] >= 0:
+            stk.append(u)
+            u = parent[u]
+        o = origin[u] if origin[u] >= 0 else (u if dist[u] == 0 else -1)
+        origin[u] = o
+        for x in stk:
+            origin[x] = o
+    return dist, origin
+
+# Batch of (src, dst) queries: one dijkstra per distinct source, each stops
+# as soon as all of that source's targets are settled. Returns distances in
+# query order.
+def batch_shortest_paths(adj, queries, heap='binary'):
+    g = _as_weighted_csr(adj)
+    by_src = {}
+    for i, (s, t) in enumerate(queries):
+        by_src.setdefault(s, []).append((t, i))
+    res = [INF] * len(queries)
+    offsets, targets, weights = g.offsets, g.targets, g.weights
+    for s, wanted in by_src.items():
+        pending = {t for t, _ in wanted}
+        dist = [INF] * g.V
+        done = bytearray(g.V)
+        pq = _new_heap(heap, g)
+        dist[s] = 0
+        pq.push(0, s)
+        while pq and pending:
+            du, u = pq.pop()
+            done[u] = 1
+            pending.discard(u)
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = du + weights[k]
+                if nd < dist[v] and not done[v]:
+                    dist[v] = nd
+                    pq.push_or_decrease(nd, v)
+        for t, i in wanted:
+            res[i] = dist[t]
+    return res
+
+
+if __name__ == "__main__":
+    V = 6
+    adj = [[] for _ in range(V)]
+    addWeightedEdge(adj, 0, 1, 7)
+    addWeightedEdge(adj, 0, 2, 9)
+    addWeightedEdge(adj, 0, 5, 14)
+    addWeightedEdge(adj, 1, 2, 10)
+    addWeightedEdge(adj, 2, 5, 2)
+    addWeightedEdge(adj, 4, 5, 9)
+    addWeightedEdge(adj, 3, 4, 6)
+
+    for heap in HEAPS:
+        dist, parent = dijkstra(adj, 0, heap=heap)
+        print(heap, dist, path_from_parents(parent, 0, 4))
+    print(astar(adj, 0, 4, lambda v: 0))
+    print(bidirectional_dijkstra(adj, 0, 4, reverse=adj))
+    dist, origin = multi_source_dijkstra(adj, [0, 3])
+    print(dist, origin.tolist())
+    print(batch_shortest_paths(adj, [(0, 4), (3, 0), (0, 2)]))
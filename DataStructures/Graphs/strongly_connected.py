@@ -1,4 +1,6 @@
 from collections import defaultdict
+from array import array
+from csr_graph import CSRGraph
 
 class Graph:
     def __init__(self, vertices):
@@ -9,57 +11,140 @@ class Graph:
     def add_edge(self, u, v):
         self.graph[u].append(v)
 
-    # Step 1: Standard DFS to store nodes in stack by finish time
-    def _dfs_fill_order(self, v, visited, stack):
-        visited[v] = True
-        for neighbor in self.graph[v]:
-            if not visited[neighbor]:
-                self._dfs_fill_order(neighbor, visited, stack)
-        # Push to stack when all neighbors are visited (Finish Time)
-        stack.append(v)
-
-    # Function to get the Transpose (Reversed) Graph
-    def _get_transpose(self):
-        g_t = Graph(self.V)
-        for i in self.graph:
-            for j in self.graph[i]:
-                g_t.add_edge(j, i) # Reverse direction: u->v becomes v->u
-        return g_t
-
-    # Step 3: DFS on the Transposed Graph
-    def _dfs_print_scc(self, v, visited, current_component):
-        visited[v] = True
-        current_component.append(v)
-        for neighbor in self.graph[v]:
-            if not visited[neighbor]:
-                self._dfs_print_scc(neighbor, visited, current_component)
+    # Flat CSR copy of the adjacency list, neighbour order is preserved
+    def to_csr(self):
+        src, dst = array('i'), array('i')
+        for u in range(self.V):
+            for v in self.graph.get(u, ()):
+                src.append(u)
+                dst.append(v)
+        return CSRGraph.from_edges(self.V, src, dst, directed=True)
 
     # Main function to find and print SCCs
+    # (Kosaraju over CSR arrays, no recursion and no transposed Graph object)
     def print_sccs(self):
-        stack = []
-        visited = [False] * self.V
-
-        # 1. Fill stack based on finishing times
-        for i in range(self.V):
-            if not visited[i]:
-                self._dfs_fill_order(i, visited, stack)
-
-        # 2. Create a reversed graph
-        gr = self._get_transpose()
-
-        # 3. Process all vertices in order defined by stack
-        visited = [False] * self.V
-        sccs = []
-        
-        while stack:
-            i = stack.pop()
-            if not visited[i]:
-                component = []
-                gr._dfs_print_scc(i, visited, component)
-                sccs.append(component)
-        
+        comp, n = kosaraju_scc(self.to_csr())
+        sccs = [[] for _ in range(n)]
+        for v in range(self.V):
+            sccs[comp[v]].append(v)
         return sccs
 
+
+# Both functions take a CSRGraph and return (comp, count):
+# comp[v] is the component id of vertex v.
+# Every dfs keeps its own stack of vertices plus a "next edge" cursor per
+# vertex (nxt), so the depth of the graph never touches the recursion limit.
+
+# Tarjan: single dfs pass, no transpose needed.
+# Component ids come out in reverse topological order (sink components first).
+def tarjan_scc(g):
+    V, offsets, targets = g.V, g.offsets, g.targets
+    index = array('i', [-1]) * V
+    low = array('i', [0]) * V
+    comp = array('i', [-1]) * V
+    nxt = offsets[:-1]
+    onstack = bytearray(V)
+    stack, counter, n = [], 0, 0
+
+    for s in range(V):
+        if index[s] != -1:
+            continue
+        index[s] = low[s] = counter
+        counter += 1
+        stack.append(s)
+        onstack[s] = 1
+        call = [s]
+        while call:
+            v = call[-1]
+            k = nxt[v]
+            if k < offsets[v + 1]:
+                nxt[v] = k + 1
+                w = targets[k]
+                if index[w] == -1:  # tree edge: "recurse" into w
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    onstack[w] = 1
+                    call.append(w)
+                elif onstack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+                continue
+            # all edges of v done: "return" to the caller
+            call.pop()
+            if call and low[v] < low[call[-1]]:
+                low[call[-1]] = low[v]
+            if low[v] == index[v]:  # v is the root of a component
+                while True:
+                    w = stack.pop()
+                    onstack[w] = 0
+                    comp[w] = n
+                    if w == v:
+                        break
+                n += 1
+    return comp, n
+
+# Kosaraju: 1) dfs finish order on g  2) dfs on the CSR transpose in reverse
+# finish order. Component ids come out in topological order (sources first).
+def kosaraju_scc(g):
+    V, offsets, targets = g.V, g.offsets, g.targets
+    visited = bytearray(V)
+    nxt = offsets[:-1]
+    order = array('i')  # vertices by finish time
+
+    for s in range(V):
+        if visited[s]:
+            continue
+        visited[s] = 1
+        call = [s]
+        while call:
+            v = call[-1]
+            k = nxt[v]
+            if k < offsets[v + 1]:
+                nxt[v] = k + 1
+                w = targets[k]
+                if not visited[w]:
+                    visited[w] = 1
+                    call.append(w)
+            else:
+                call.pop()
+                order.append(v)
+
+    gt = g.transpose()
+    toffsets, ttargets = gt.offsets, gt.targets
+    comp = array('i', [-1]) * V
+    n = 0
+    for i in range(V - 1, -1, -1):
+        s = order[i]
+        if comp[s] != -1:
+            continue
+        comp[s] = n
+        stk = [s]
+        while stk:
+            v = stk.pop()
+            for k in range(toffsets[v], toffsets[v + 1]):
+                w = ttargets[k]
+                if comp[w] == -1:
+                    comp[w] = n
+                    stk.append(w)
+        n += 1
+    return comp, n
+
+# Condensation DAG: one vertex per component, one edge per pair of
+# components joined by at least one edge (duplicates and self loops dropped)
+def condensation(g, comp, n):
+    offsets, targets = g.offsets, g.targets
+    seen = set()
+    src, dst = array('i'), array('i')
+    for u in range(g.V):
+        cu = comp[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            cv = comp[targets[k]]
+            if cu != cv and cu * n + cv not in seen:
+                seen.add(cu * n + cv)
+                src.append(cu)
+                dst.append(cv)
+    return CSRGraph.from_edges(n, src, dst, directed=True)
+
 # --- Example Usage ---
 if __name__ == "__main__":
     # Create a graph with 5 vertices (0 to 4)
@@ -72,6 +157,17 @@ if __name__ == "__main__":
 
     print("Strongly Connected Components:")
     results = g.print_sccs()
-    
+
     for idx, scc in enumerate(results):
-        print(f"Component {idx + 1}: {scc}")
\ No newline at end of file
+        print(f"Component {idx + 1}: {scc}")
+
+    csr = g.to_csr()
+    comp, n = tarjan_scc(csr)
+    print("Tarjan component ids:", comp.tolist())
+    dag = condensation(csr, comp, n)
+    print("Condensation DAG:", dag.to_adj())
+
+    # a 100000 long chain, far deeper than the recursion limit
+    N = 100000
+    chain = CSRGraph.from_edges(N, range(N - 1), range(1, N), directed=True)
+    print(tarjan_scc(chain)[1], kosaraju_scc(chain)[1])
@@ -0,0 +1,215 @@
+# AVL tree used as an ordered map (key -> value)
+# after every insert / delete the heights of the two subtrees of any node
+# differ by at most 1, so the height stays ~1.44*log(n) even when keys
+# arrive in sorted order (a plain bst would turn into a linked list).
+# every node also keeps the size of its subtree -> rank/select in O(logn)
+# search, insert and delete are loops with an explicit path, no recursion.
+
+class AVLNode:
+    __slots__ = ('key', 'value', 'left', 'right', 'height', 'size')
+    def __init__(self, key, value=None):
+        self.key = key
+        self.value = value
+        self.left = self.right = None
+        self.height = 1
+        self.size = 1
+
+def _height(n):
+    return n.height if n else 0
+
+def _size(n):
+    return n.size if n else 0
+
+def _update(n):
+    lh, rh = _height(n.left), _height(n.right)
+    n.height = (lh if lh > rh else rh) + 1
+    n.size = _size(n.left) + _size(n.right) + 1
+
+def _rotate_right(y):
+    x = y.left
+    y.left, x.right = x.right, y
+    _update(y)
+    _update(x)
+    return x
+
+def _rotate_left(x):
+    y = x.right
+    x.right, y.left = y.left, x
+    _update(x)
+    _update(y)
+    return y
+
+# fix the heights/sizes of n and rotate if it is out of balance,
+# returns the new root of this subtree
+def _rebalance(n):
+    _update(n)
+    balance = _height(n.left) - _height(n.right)
+    if balance > 1:
+        if _height(n.left.left) < _height(n.left.right):  # left-right case
+            n.left = _rotate_left(n.left)
+        return _rotate_right(n)
+    if balance < -1:
+        if _height(n.right.right) < _height(n.right.left):  # right-left case
+            n.right = _rotate_right(n.right)
+        return _rotate_left(n)
+    return n
+
+class AVLTree:
+    def __init__(self, items=()):
+        self.root = None
+        for k, v in items:
+            self.insert(k, v)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        for k, _ in self.items():
+            yield k
+
+    def _find(self, key):
+        n = self.root
+        while n and n.key != key:
+            n = n.left if key < n.key else n.right
+        return n
+
+    def get(self, key, default=None):
+        n = self._find(key)
+        return n.value if n else default
+
+    def search(self, key):
+        return self._find(key)
+
+    # walk back up the path rebalancing every node and re-linking rotated subtrees
+    def _fix_path(self, path):
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new = _rebalance(node)
+            if new is not node:
+                if i == 0:
+                    self.root = new
+                elif path[i - 1].left is node:
+                    path[i - 1].left = new
+                else:
+                    path[i - 1].right = new
+
+    def insert(self, key, value=None):
+        if self.root is None:
+            self.root = AVLNode(key, value)
+            return
+        path, n = [], self.root
+        while n:
+            if key == n.key:  # existing key: just replace the value
+                n.value = value
+                return
+            path.append(n)
+            n = n.left if key < n.key else n.right
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = AVLNode(key, value)
+        else:
+            parent.right = AVLNode(key, value)
+        self._fix_path(path)
+
+    # returns the value of the removed key, raises KeyError if missing
+    def delete(self, key):
+        path, n = [], self.root
+        while n and n.key != key:
+            path.append(n)
+            n = n.left if key < n.key else n.right
+        if n is None:
+            raise KeyError(key)
+        value = n.value
+        if n.left and n.right:
+            # two children: take over the successor's key and remove it instead
+            path.append(n)
+            s = n.right
+            while s.left:
+                path.append(s)
+                s = s.left
+            n.key, n.value = s.key, s.value
+            n = s
+        child = n.left or n.right
+        if not path:
+            self.root = child
+        elif path[-1].left is n:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._fix_path(path)
+        return value
+
+    # k-th smallest key (0 based)
+    def select(self, k):
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        n = self.root
+        while True:
+            ls = _size(n.left)
+            if k < ls:
+                n = n.left
+            elif k == ls:
+                return n.key
+            else:
+                k -= ls + 1
+                n = n.right
+
+    # number of keys smaller than key (or <= key when inclusive)
+    def rank(self, key, inclusive=False):
+        r, n = 0, self.root
+        while n:
+            if key < n.key or (key == n.key and not inclusive):
+                n = n.left
+            else:
+                r += _size(n.left) + 1
+                n = n.right
+        return r
+
+    def count_range(self, lo, hi):
+        return max(0, self.rank(hi, inclusive=True) - self.rank(lo))
+
+    # (key, value) pairs with lo <= key <= hi in order, lazily
+    def items(self, lo=None, hi=None):
+        stk, n = [], self.root
+        while stk or n:
+            while n:
+                if lo is not None and n.key < lo:
+                    n = n.right  # whole left subtree is below lo
+                else:
+                    stk.append(n)
+                    n = n.left
+            if not stk:
+                return
+            n = stk.pop()
+            if hi is not None and n.key > hi:
+                return
+            yield n.key, n.value
+            n = n.right
+
+    def min(self):
+        n = self.root
+        while n.left:
+            n = n.left
+        return n.key
+
+    def max(self):
+        n = self.root
+        while n.right:
+            n = n.right
+        return n.key
+
+    def height(self):
+        return _height(self.root)
+
+
+if __name__ == "__main__":
+    t = AVLTree()
+    for k in range(1, 1001):  # sorted input, height stays logarithmic
+        t.insert(k, k * k)
+    print(len(t), t.height(), t.get(10))
+    t.delete(10)
+    print(10 in t, t.select(9), t.rank(500), t.count_range(100, 199))
+    print(list(t.items(5, 12)))
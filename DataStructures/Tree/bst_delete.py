@@ -17,6 +17,54 @@ class Tree:
         else: parent.right = temp
         return temp
 
+    # bst insert: walk down from the root to the empty slot for data
+    def bst_insert(self,data):
+        if not self.root:
+            self.root = Node(data)
+            return self.root
+        r = self.root
+        while True:
+            if data < r.data:
+                if not r.left:
+                    r.left = Node(data)
+                    return r.left
+                r = r.left
+            else:
+                if not r.right:
+                    r.right = Node(data)
+                    return r.right
+                r = r.right
+
+    # bst delete, iterative: 0/1 child -> splice the node out,
+    # 2 children -> copy the inorder successor up and splice the successor out
+    def delete(self,data):
+        parent, r = None, self.root
+        while r and r.data != data:
+            parent, r = r, (r.left if data < r.data else r.right)
+        if not r: return False
+        if r.left and r.right:
+            sparent, s = r, r.right
+            while s.left:
+                sparent, s = s, s.left
+            r.data = s.data
+            parent, r = sparent, s
+        child = r.left or r.right
+        if not parent: self.root = child
+        elif parent.left is r: parent.left = child
+        else: parent.right = child
+        return True
+
+    def inorder(self):
+        res, stk, r = [], [], self.root
+        while stk or r:
+            while r:
+                stk.append(r)
+                r = r.left
+            r = stk.pop()
+            res.append(r.data)
+            r = r.right
+        return res
+
 
 tree = Tree()
 r = tree.insert(10,None)
@@ -24,3 +72,10 @@ tl1=  tree.insert(20,r)
 tr1 = tree.insert(30,r,1)
 trf2 = tree.insert(40,tr1)
 trr2 = tree.insert(50,tr1,1)
+
+bst = Tree()
+for x in [50, 30, 70, 20, 40, 60, 80]:
+    bst.bst_insert(x)
+bst.delete(30)
+bst.delete(50)
+print(bst.inorder())
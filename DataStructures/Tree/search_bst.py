@@ -14,8 +14,7 @@
         # preorder(node)
 class Solution:
     def searchBST(self, root: Optional[TreeNode], val: int) -> Optional[TreeNode]:
-        if not root: return None
-        if root.val == val: return root
-        if val < root.val: return self.searchBST(root.left,val)
-        if val > root.val: return self.searchBST(root.right,val)
-        return None
\ No newline at end of file
+        # walk down instead of recursing, no stack growth on skewed trees
+        while root and root.val != val:
+            root = root.left if val < root.val else root.right
+        return root
\ No newline at end of file
@@ -1,33 +1,164 @@
 import math
+# every node caches size, height, min and max of its own subtree.
+# they are fixed up along the parent chain whenever the tree changes,
+# so size / height / max of any subtree is an O(1) field read instead of a
+# full (recursive) walk on every call.
+# bst_insert keeps the tree AVL balanced (same rotations as avl_tree.py, here
+# with parent pointers and the extra aggregates), so a tree built with it
+# stays O(logn) high even for sorted input: bst_insert, kth_smallest, rank
+# and tsearch are O(logn). insert() at a given parent does not rebalance.
 class Node:
     def __init__(self,data,left=None,right=None):
         self.data = data
         self.left = left
         self.right = right
+        self.parent = None
+        for c in (left, right):
+            if c: c.parent = self
+        self._pull()
+
+    # recompute the cached aggregates from the (already correct) children,
+    # missing children are skipped so data only has to be comparable
+    def _pull(self):
+        l, r = self.left, self.right
+        self.size = 1 + (l.size if l else 0) + (r.size if r else 0)
+        self.height = 1 + max(l.height if l else 0, r.height if r else 0)
+        lo = hi = self.data
+        for c in (l, r):
+            if c:
+                if c.min < lo: lo = c.min
+                if c.max > hi: hi = c.max
+        self.min, self.max = lo, hi
 
 class Tree:
     def __init__(self,root=None):
         self.root = root
+        self.counts = {}  # value -> how many nodes hold it, O(1) search
+        if root: self._count(root, 1)
+
+    def _count(self,r,delta):
+        stk = [r]
+        while stk:
+            n = stk.pop()
+            self.counts[n.data] = self.counts.get(n.data, 0) + delta
+            if not self.counts[n.data]: del self.counts[n.data]
+            stk.extend(c for c in (n.left, n.right) if c)
+
+    # fix size/height/max from node up to the root, O(depth)
+    # returns the top node reached, the tree root unless node is detached
+    def _pull_up(self,node):
+        while True:
+            node._pull()
+            if not node.parent: return node
+            node = node.parent
+
     def insert(self,data,parent,isright=0):
         temp = Node(data)
-        if not self.root: 
+        if not self.root:
             self.root = temp
+            self.counts[data] = 1
             return temp
+        old = parent.right if isright else parent.left
         if not isright:  parent.left =temp
         else: parent.right = temp
+        temp.parent = parent
+        if self._pull_up(parent) is self.root:
+            self.counts[data] = self.counts.get(data, 0) + 1
+            if old: self._count(old, -1)  # replaced subtree drops out of the tree
+        if old: old.parent = None
+        return temp
+
+    # x's child on the left (right=True) or right side moves up into x's place
+    def _rotate(self,x,right):
+        y = x.left if right else x.right
+        mid = y.right if right else y.left
+        if right: x.left, y.right = mid, x
+        else: x.right, y.left = mid, x
+        if mid: mid.parent = x
+        p = x.parent
+        x.parent, y.parent = y, p
+        if not p: self.root = y
+        elif p.left is x: p.left = y
+        else: p.right = y
+        x._pull()
+        y._pull()
+        return y
+
+    # avl_tree._rebalance on a node with parent pointers, returns the new subtree root
+    def _rebalance(self,n):
+        n._pull()
+        balance = h(n.left) - h(n.right)
+        if balance > 1:
+            if h(n.left.left) < h(n.left.right):  # left-right case
+                self._rotate(n.left, False)
+            return self._rotate(n, True)
+        if balance < -1:
+            if h(n.right.right) < h(n.right.left):  # right-left case
+                self._rotate(n.right, True)
+            return self._rotate(n, False)
+        return n
+
+    # insert keeping bst order (smaller left, equal right) and the tree
+    # balanced, O(logn). Rotations may move equal values to the left of each
+    # other, the order stays left <= node <= right.
+    def bst_insert(self,data):
+        if not self.root: return self.insert(data, None)
+        r = self.root
+        while True:
+            isright = data >= r.data
+            nxt = r.right if isright else r.left
+            if not nxt: break
+            r = nxt
+        temp = self.insert(data, r, isright)
+        while r:
+            r = self._rebalance(r).parent
         return temp
+
     def size(self,r):
-        if not r: return 0
-        sz = 0
-        sz+= self.size(r.left)
-        sz+=1
-        sz+= self.size(r.right)
-        return sz
-
-size = lambda r : 0 if not r else size(r.left)+1+size(r.right)
-tmax = lambda r : -math.inf if not r  else max(tmax(r.left),r.data,tmax(r.right))
-tsearch = lambda r,k : False if not r  else any([tsearch(r.left,k),r.data==k,tsearch(r.right,k)])
-h = lambda r: 0 if not r else  max(h(r.left),h(r.right))+1
+        return r.size if r else 0
+
+    def search(self,k):
+        return k in self.counts
+
+    # order statistics, the tree must be in bst order (see bst_insert)
+    # k-th smallest value, k starting at 1, O(height) = O(logn) after bst_insert
+    def kth_smallest(self,k):
+        r = self.root
+        if not 1 <= k <= self.size(r): raise IndexError("k out of range")
+        while r:
+            ls = self.size(r.left)
+            if k <= ls: r = r.left
+            elif k == ls + 1: return r.data
+            else:
+                k -= ls + 1
+                r = r.right
+
+    # how many values are smaller than k, O(height)
+    def rank(self,k):
+        res, r = 0, self.root
+        while r:
+            if k <= r.data: r = r.left
+            else:
+                res += self.size(r.left) + 1
+                r = r.right
+        return res
+
+size = lambda r : 0 if not r else r.size
+tmax = lambda r : -math.inf if not r  else r.max
+h = lambda r: 0 if not r else r.height
+
+# subtrees whose [min, max] does not contain k are skipped without being
+# visited. Any tree works; in bst order at most one child's range holds k
+# (bar duplicates of k), so the walk is a single path: O(logn) after bst_insert.
+def tsearch(r,k):
+    stk = [r] if r else []
+    while stk:
+        n = stk.pop()
+        if n.min <= k <= n.max:
+            if n.data == k: return True
+            if n.left: stk.append(n.left)
+            if n.right: stk.append(n.right)
+    return False
 
 tree = Tree()
 r = tree.insert(10,None)
@@ -38,16 +169,21 @@ trr2 = tree.insert(50,tr1,1)
 print(tree.size(r))
 print(size(r))
 print(tmax(r))
-print(tsearch(r,10))
+print(tsearch(r,10), tree.search(10))
 print(h(r))
 
+bst = Tree()
+for x in [50, 30, 70, 20, 40, 60, 80]:
+    bst.bst_insert(x)
+print(bst.kth_smallest(3), bst.rank(60))
+
 # gpt code #TODO
-search = (lambda k: (lambda r: False if not r else any([t(r.left), r.data == k, t(r.right)]))) 
+search = (lambda k: (lambda r: False if not r else any([t(r.left), r.data == k, t(r.right)])))
 t = lambda r: search(r)
 root = Node(5, Node(3, Node(1), Node(4)), Node(7, Node(6), Node(8)))
 srch = search(10)
 print(srch(r))
 
-#TODO : do preorder tranversal iterative
-
-        
\ No newline at end of file
+# preorder tranversal iterative (lazy generators in traversal.py)
+from traversal import preorder, morris_inorder
+print([n.data for n in preorder(r)], [n.data for n in morris_inorder(root)])
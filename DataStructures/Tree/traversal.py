@@ -0,0 +1,131 @@
+from collections import deque
+
+# Lazy, iterative traversals for any binary tree whose nodes have .left/.right
+# (Node in tree.py/size_tree.py, TreeNode in search_bst.py, ...).
+# They yield nodes one by one, so a consumer can stop early (break) and
+# only pays for the nodes it looked at. Skewed trees are fine, nothing recurses.
+
+# stack holds at most height nodes
+def preorder(root):
+    stk = [root] if root else []
+    while stk:
+        n = stk.pop()
+        yield n
+        if n.right: stk.append(n.right)
+        if n.left: stk.append(n.left)
+
+def inorder(root):
+    stk, n = [], root
+    while stk or n:
+        while n:
+            stk.append(n)
+            n = n.left
+        n = stk.pop()
+        yield n
+        n = n.right
+
+# a node is emitted once its right subtree is done (prev is the last node emitted)
+def postorder(root):
+    stk, n, prev = [], root, None
+    while stk or n:
+        while n:
+            stk.append(n)
+            n = n.left
+        top = stk[-1]
+        if top.right and top.right is not prev:
+            n = top.right
+        else:
+            prev = stk.pop()
+            yield prev
+
+# queue holds at most one level
+def levelorder(root):
+    q = deque([root] if root else [])
+    while q:
+        n = q.popleft()
+        yield n
+        if n.left: q.append(n.left)
+        if n.right: q.append(n.right)
+
+
+# Morris traversal: O(1) extra memory, no stack and no queue.
+# Before going left, the rightmost node of the left subtree (the inorder
+# predecessor) gets a temporary right pointer ("thread") back to the current
+# node; the thread is used to come back up and is removed on the second visit.
+# The tree is back to its original shape once the walk ends. If the consumer
+# stops early, the finally block walks the rest of the tree (without yielding)
+# only to remove the threads still in place.
+
+def _morris_finish(cur):
+    while cur:
+        if cur.left is None:
+            cur = cur.right
+            continue
+        pre = cur.left
+        while pre.right and pre.right is not cur:
+            pre = pre.right
+        if pre.right is None:
+            pre.right = cur
+            cur = cur.left
+        else:
+            pre.right = None
+            cur = cur.right
+
+def morris_inorder(root):
+    cur = root
+    try:
+        while cur:
+            if cur.left is None:
+                node, cur = cur, cur.right
+                yield node
+                continue
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+            if pre.right is None:  # first visit: thread and go left
+                pre.right = cur
+                cur = cur.left
+            else:  # back through the thread: left subtree done
+                pre.right = None
+                node, cur = cur, cur.right
+                yield node
+    finally:
+        _morris_finish(cur)
+
+def morris_preorder(root):
+    cur = root
+    try:
+        while cur:
+            if cur.left is None:
+                node, cur = cur, cur.right
+                yield node
+                continue
+            pre = cur.left
+            while pre.right and pre.right is not cur:
+                pre = pre.right
+            if pre.right is None:
+                pre.right = cur
+                node, cur = cur, cur.left
+                yield node
+            else:
+                pre.right = None
+                cur = cur.right
+    finally:
+        _morris_finish(cur)
+
+
+if __name__ == "__main__":
+    class Node:
+        def __init__(self,data,left=None,right=None):
+            self.data, self.left, self.right = data, left, right
+
+    root = Node(5, Node(3, Node(1), Node(4)), Node(7, Node(6), Node(8)))
+    for walk in (preorder, inorder, postorder, levelorder, morris_inorder, morris_preorder):
+        print(walk.__name__, [n.data for n in walk(root)])
+
+    # stop after the first 3 nodes, the tree is left untouched
+    first = []
+    for n in morris_inorder(root):
+        first.append(n.data)
+        if len(first) == 3: break
+    print(first, [n.data for n in inorder(root)])
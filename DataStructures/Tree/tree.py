@@ -1,6 +1,12 @@
 from collections import deque
+from array import array
 import logging
 
+try:
+    import numpy as np
+except ImportError:  # batch queries fall back to a python loop
+    np = None
+
 logging.basicConfig(level=logging.DEBUG)
 
 # Function to add an edge between vertices x and y
@@ -61,6 +67,140 @@ def printDegrees(Root, adj):
 
 
 
+# Compiled (flat) form of a rooted tree: everything lives in int arrays indexed
+# by node id, built once with an iterative dfs, so queries never recurse and
+# never print.
+#   parent / depth / first_child / next_sibling  (-1 = none)
+#   tin / tout: dfs entry time and the last entry time inside the subtree,
+#               u is an ancestor of v  <=>  tin[u] <= tin[v] <= tout[u]   O(1)
+#   euler: node sequence of the dfs walk (2n-1 long), LCA(u, v) is the
+#          shallowest node of euler between the first visits of u and v,
+#          answered in O(1) with a sparse table of range minimums.
+# Nodes not reachable from root (e.g. the unused index 0) keep depth -1.
+class FlatTree:
+    def __init__(self, adj, root):
+        n = len(adj)
+        self.n, self.root = n, root
+        parent = self.parent = array('i', [-1]) * n
+        depth = self.depth = array('i', [-1]) * n
+        first_child = self.first_child = array('i', [-1]) * n
+        next_sibling = self.next_sibling = array('i', [-1]) * n
+        tin = self.tin = array('i', [-1]) * n
+        tout = self.tout = array('i', [-1]) * n
+        first = self.first = array('i', [-1]) * n  # first position in euler
+        euler = self.euler = array('i')
+        last_child = array('i', [-1]) * n
+        cursor = array('i', [0]) * n
+
+        depth[root], tin[root], first[root] = 0, 0, 0
+        euler.append(root)
+        timer, stk = 1, [root]
+        while stk:
+            u = stk[-1]
+            nbrs = adj[u]
+            if cursor[u] < len(nbrs):
+                v = nbrs[cursor[u]]
+                cursor[u] += 1
+                if v == parent[u]:
+                    continue
+                parent[v], depth[v] = u, depth[u] + 1
+                if last_child[u] < 0: first_child[u] = v
+                else: next_sibling[last_child[u]] = v
+                last_child[u] = v
+                tin[v], first[v] = timer, len(euler)
+                timer += 1
+                euler.append(v)
+                stk.append(v)
+            else:
+                stk.pop()
+                tout[u] = timer - 1
+                if stk: euler.append(stk[-1])
+        self._build_sparse()
+
+    # tree given as linked nodes with a children list (treenode.Node),
+    # ids are assigned in bfs order, self.nodes maps id -> node
+    @classmethod
+    def from_node(cls, root):
+        nodes, adj = [root], []
+        for node in nodes:  # nodes grows while we iterate -> bfs
+            adj.append(list(range(len(nodes), len(nodes) + len(node.children))))
+            nodes.extend(node.children)
+        t = cls(adj, 0)
+        t.nodes = nodes
+        return t
+
+    # sp[k][i] = shallowest node among euler[i : i + 2**k]
+    def _build_sparse(self):
+        depth, prev = self.depth, self.euler
+        self.sp = [prev]
+        k = 1
+        while (1 << k) <= len(self.euler):
+            half = 1 << (k - 1)
+            cur = array('i', [0]) * (len(prev) - half)
+            for i in range(len(cur)):
+                a, b = prev[i], prev[i + half]
+                cur[i] = a if depth[a] <= depth[b] else b
+            self.sp.append(cur)
+            prev = cur
+            k += 1
+
+    def lca(self, u, v):
+        l, r = self.first[u], self.first[v]
+        if l > r: l, r = r, l
+        k = (r - l + 1).bit_length() - 1
+        a, b = self.sp[k][l], self.sp[k][r - (1 << k) + 1]
+        return a if self.depth[a] <= self.depth[b] else b
+
+    def is_ancestor(self, u, v):  # u == v counts as ancestor
+        return self.tin[u] <= self.tin[v] <= self.tout[u]
+
+    def distance(self, u, v):
+        return self.depth[u] + self.depth[v] - 2 * self.depth[self.lca(u, v)]
+
+    def children(self, u):
+        res, c = array('i'), self.first_child[u]
+        while c >= 0:
+            res.append(c)
+            c = self.next_sibling[c]
+        return res
+
+    def leaves(self):
+        return array('i', [u for u in range(self.n) if self.depth[u] >= 0 and self.first_child[u] < 0])
+
+    # degree as printed by printDegrees: number of children
+    def degrees(self):
+        deg = array('i', [0]) * self.n
+        for u in range(self.n):
+            if self.parent[u] >= 0: deg[self.parent[u]] += 1
+        return deg
+
+    # many queries at once, us / vs are equal length int sequences;
+    # with numpy the whole batch is a few array gathers
+    def lca_many(self, us, vs):
+        if np is None:
+            return array('i', map(self.lca, us, vs))
+        if not hasattr(self, '_np'):
+            depth = np.frombuffer(self.depth, dtype=np.intc)
+            sp = np.full((len(self.sp), len(self.euler)), -1, dtype=np.intc)
+            for k, row in enumerate(self.sp):
+                sp[k, :len(row)] = np.frombuffer(row, dtype=np.intc)
+            self._np = (depth, sp, np.frombuffer(self.first, dtype=np.intc))
+        depth, sp, first = self._np
+        fu, fv = first[np.asarray(us)], first[np.asarray(vs)]
+        l, r = np.minimum(fu, fv), np.maximum(fu, fv)
+        k = np.log2(r - l + 1).astype(np.intc)
+        a, b = sp[k, l], sp[k, r - (1 << k) + 1]
+        return np.where(depth[a] <= depth[b], a, b)
+
+    def is_ancestor_many(self, us, vs):
+        if np is None:
+            return [self.is_ancestor(u, v) for u, v in zip(us, vs)]
+        tin = np.frombuffer(self.tin, dtype=np.intc)
+        tout = np.frombuffer(self.tout, dtype=np.intc)
+        us, vs = np.asarray(us), np.asarray(vs)
+        return (tin[us] <= tin[vs]) & (tin[vs] <= tout[us])
+
+
 if __name__ == "__main__":
     # Driver code
     N = 7
@@ -90,4 +230,13 @@ if __name__ == "__main__":
 
     # Printing the degrees of each node
     print("The degrees of each node are:")
-    printDegrees(Root, adj)
\ No newline at end of file
+    printDegrees(Root, adj)
+
+    # compiled form: same answers as arrays, plus O(1) LCA / ancestor checks
+    ft = FlatTree(adj, Root)
+    print("parents:", ft.parent.tolist())
+    print("children of 1:", ft.children(1).tolist())
+    print("leaves:", ft.leaves().tolist(), "degrees:", ft.degrees().tolist())
+    print("lca(5, 6) =", ft.lca(5, 6), "lca(5, 7) =", ft.lca(5, 7))
+    print("is 2 an ancestor of 6:", ft.is_ancestor(2, 6), "of 7:", ft.is_ancestor(2, 7))
+    print(ft.lca_many([5, 6, 3], [6, 7, 3]).tolist())
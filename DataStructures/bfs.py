@@ -11,6 +11,22 @@ def bfs(graph,start):
                 visited.add(v)
                 q.append(v)
 
+# level by level: expand the whole frontier at once and record the
+# hop distance and bfs-tree parent of every reachable node
+def bfs_levels(graph, start):
+    dist, parent = {start: 0}, {start: None}
+    frontier, level = [start], 0
+    while frontier:
+        level += 1
+        nxt = []
+        for n in frontier:
+            for v in graph[n]:
+                if v not in dist:
+                    dist[v] = level
+                    parent[v] = n
+                    nxt.append(v)
+        frontier = nxt
+    return dist, parent
 
 graph = {
     'A': ['B', 'C'],
@@ -21,4 +37,6 @@ graph = {
     'F': ['C', 'E']
 }
 
-bfs(graph, 'A') #start the bfs from node A.
\ No newline at end of file
+bfs(graph, 'A') #start the bfs from node A.
+print()
+print(bfs_levels(graph, 'A'))
\ No newline at end of file
@@ -0,0 +1,195 @@
+# Range queries on an array that keeps changing.
+# A prefix sum array answers sum(l..r) in O(1) but one update costs O(n);
+# these trees answer and update in O(logn). All indexes are 0 based and
+# ranges [l, r] are inclusive. Building from a list is O(n).
+
+# Fenwick tree (binary indexed tree): tree[i] holds the sum of the
+# (i & -i) elements ending at position i (1 based inside the tree).
+class FenwickTree:
+    def __init__(self, arr):
+        self.n = len(arr)
+        self.tree = [0] + list(arr)
+        for i in range(1, self.n + 1):  # O(n): push every node into its parent once
+            j = i + (i & -i)
+            if j <= self.n:
+                self.tree[j] += self.tree[i]
+
+    def add(self, i, delta):
+        i += 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    # sum of the first i elements, arr[0..i-1]
+    def prefix_sum(self, i):
+        s = 0
+        while i > 0:
+            s += self.tree[i]
+            i -= i & -i
+        return s
+
+    def range_sum(self, l, r):
+        return self.prefix_sum(r + 1) - self.prefix_sum(l)
+
+    def get(self, i):
+        return self.range_sum(i, i)
+
+    def set(self, i, value):
+        self.add(i, value - self.get(i))
+
+    # smallest i with arr[0] + ... + arr[i] >= target, n if there is none.
+    # needs non negative values (prefix sums must not decrease); walks down
+    # the implicit tree one bit at a time, O(logn)
+    def lower_bound(self, target):
+        pos, step = 0, 1 << self.n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] < target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return pos
+
+
+# range add + range sum with two fenwick trees:
+# prefix_sum(i) = b1.prefix_sum(i) * i - b2.prefix_sum(i)
+class RangeFenwickTree:
+    def __init__(self, arr):
+        self.n = len(arr)
+        self.base = FenwickTree(arr)  # sums of the initial values
+        self.b1 = FenwickTree([0] * self.n)
+        self.b2 = FenwickTree([0] * self.n)
+
+    def range_add(self, l, r, delta):
+        self.b1.add(l, delta)
+        self.b2.add(l, delta * l)
+        if r + 1 < self.n:
+            self.b1.add(r + 1, -delta)
+            self.b2.add(r + 1, -delta * (r + 1))
+
+    def prefix_sum(self, i):
+        return self.base.prefix_sum(i) + self.b1.prefix_sum(i) * i - self.b2.prefix_sum(i)
+
+    def range_sum(self, l, r):
+        return self.prefix_sum(r + 1) - self.prefix_sum(l)
+
+
+# Iterative segment tree with lazy propagation.
+# op is 'sum', 'min' or 'max'; supports range add, point assign and range query.
+# leaves sit at [size, 2*size), node k covers the union of its two children;
+# lz[k] is an add not yet pushed down to k's children. Only the O(logn)
+# nodes on the two boundary paths are pushed / recomputed per operation.
+class SegmentTree:
+    OPS = {
+        'sum': (lambda a, b: a + b, 0),
+        'min': (min, float('inf')),
+        'max': (max, float('-inf')),
+    }
+
+    def __init__(self, arr, op='sum'):
+        if op not in self.OPS:
+            raise ValueError(f"op must be one of {sorted(self.OPS)}")
+        self.op, self.e = self.OPS[op]
+        self.is_sum = op == 'sum'
+        self.n = len(arr)
+        self.log = max(1, (self.n - 1).bit_length())
+        self.size = 1 << self.log
+        self.d = [self.e] * (2 * self.size)
+        self.lz = [0] * self.size
+        self.d[self.size:self.size + self.n] = arr
+        for k in range(self.size - 1, 0, -1):
+            self._pull(k)
+
+    def _pull(self, k):
+        self.d[k] = self.op(self.d[2 * k], self.d[2 * k + 1])
+
+    def _apply(self, k, delta):
+        # a sum node grows by delta for every leaf below it
+        self.d[k] += delta * (self.size >> (k.bit_length() - 1)) if self.is_sum else delta
+        if k < self.size:
+            self.lz[k] += delta
+
+    def _push(self, k):
+        if self.lz[k]:
+            self._apply(2 * k, self.lz[k])
+            self._apply(2 * k + 1, self.lz[k])
+            self.lz[k] = 0
+
+    # push pending adds down the paths to the boundaries of [l, r)
+    def _push_bounds(self, l, r):
+        for i in range(self.log, 0, -1):
+            if ((l >> i) << i) != l:
+                self._push(l >> i)
+            if ((r >> i) << i) != r:
+                self._push((r - 1) >> i)
+
+    def _check(self, l, r):
+        if not 0 <= l <= r < self.n:
+            raise IndexError("range out of bounds")
+
+    def query(self, l, r):
+        self._check(l, r)
+        l += self.size
+        r += self.size + 1
+        self._push_bounds(l, r)
+        left, right = self.e, self.e
+        while l < r:
+            if l & 1:
+                left = self.op(left, self.d[l])
+                l += 1
+            if r & 1:
+                r -= 1
+                right = self.op(self.d[r], right)
+            l >>= 1
+            r >>= 1
+        return self.op(left, right)
+
+    def range_add(self, l, r, delta):
+        self._check(l, r)
+        l += self.size
+        r += self.size + 1
+        self._push_bounds(l, r)
+        l0, r0 = l, r
+        while l < r:
+            if l & 1:
+                self._apply(l, delta)
+                l += 1
+            if r & 1:
+                r -= 1
+                self._apply(r, delta)
+            l >>= 1
+            r >>= 1
+        for i in range(1, self.log + 1):
+            if ((l0 >> i) << i) != l0:
+                self._pull(l0 >> i)
+            if ((r0 >> i) << i) != r0:
+                self._pull((r0 - 1) >> i)
+
+    def update(self, i, value):
+        self._check(i, i)
+        p = i + self.size
+        for k in range(self.log, 0, -1):
+            self._push(p >> k)
+        self.d[p] = value
+        for k in range(1, self.log + 1):
+            self._pull(p >> k)
+
+    def get(self, i):
+        return self.query(i, i)
+
+
+if __name__ == "__main__":
+    arr = [5, 2, 7, 1, 3, 8, 4]
+    ft = FenwickTree(arr)
+    ft.add(3, 4)                       # arr[3] = 5
+    print(ft.range_sum(1, 4), ft.lower_bound(15))
+
+    rft = RangeFenwickTree(arr)
+    rft.range_add(2, 5, 10)
+    print(rft.range_sum(0, 6))
+
+    for op in ('sum', 'min', 'max'):
+        st = SegmentTree(arr, op)
+        st.range_add(0, 3, -2)
+        st.update(6, 0)
+        print(op, st.query(0, 6), st.query(2, 4))
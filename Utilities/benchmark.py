@@ -0,0 +1,271 @@
+import argparse
+import contextlib
+import importlib.util
+import inspect
+import io
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+
+# Benchmarks every implementation of the same problem against each other.
+#
+# A family is a problem with several solvers spread over the repo (the rain
+# water solvers in Practice/trappngrainwater.py, the min loss solvers, the
+# kadane variants, the sorts). Its variants are discovered: every function
+# defined in the family's files whose name matches the family's pattern.
+# A new solver added to one of those files is benchmarked without touching
+# this file.
+#
+# For every size and input distribution, each variant runs `warmup` untimed
+# calls then `repeat` timed ones (perf_counter_ns, fresh copy of the input
+# each time, made by the family's setup before the clock starts, so only the
+# solver call itself is timed). All variants must return the same answer
+# as the first one; a disagreement is reported and makes the run fail.
+# Slow variants (O(n^2), exponential) have a size cap and are skipped above it.
+#
+# Results go to JSON (--out). With --baseline, medians are compared with a
+# previous JSON file and anything slower by more than --threshold is flagged.
+#
+#   python Utilities/benchmark.py --sizes 100,1000,10000 --out bench.json
+#   python Utilities/benchmark.py --family sort --baseline bench.json
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class Family:
+    def __init__(self, name, files, pattern, make_input, setup, finish=None, limits=None, exclude=()):
+        self.name = name
+        self.files = files            # paths relative to the repo root
+        self.pattern = re.compile(pattern)
+        self.make_input = make_input  # (n, dist, rng) -> input
+        self.setup = setup            # (fn, input) -> fresh args for fn, not timed; input must not be changed
+        self.finish = finish or (lambda res, args: res)  # (return value, args) -> answer, not timed
+        self.limits = limits or {}    # variant name -> largest n it is run on
+        self.exclude = set(exclude)
+
+# --- inputs -------------------------------------------------------------------
+
+DISTS = ('random', 'sorted', 'reversed', 'few_unique')
+
+def _ints(n, dist, rng, lo, hi):
+    if dist == 'few_unique':
+        a = [rng.choice((lo, (lo + hi) // 2, hi)) for _ in range(n)]
+    else:
+        a = [rng.randint(lo, hi) for _ in range(n)]
+    if dist == 'sorted':
+        a.sort()
+    elif dist == 'reversed':
+        a.sort(reverse=True)
+    return a
+
+def _copy_arg(fn, a):
+    return (list(a),)
+
+# in place sorts return None: the answer is the sorted argument
+def _sort_result(res, args):
+    return list(res if res is not None else args[0])
+
+def _kadane_result(res, args):
+    return res[0] if isinstance(res, tuple) else res
+
+# solvers take (N, A) or (A, N), told apart by the name of the first parameter
+def _min_loss_args(fn, a):
+    first = next(iter(inspect.signature(fn).parameters))
+    return (list(a), len(a)) if first == 'A' else (len(a), list(a))
+
+FAMILIES = {f.name: f for f in [
+    Family('rain_water', ['Practice/trappngrainwater.py'], r'.',
+           lambda n, d, rng: _ints(n, d, rng, 0, 100),
+           _copy_arg,
+           limits={'bruteforce': 2000}),
+    Family('min_cool_drink_loss', ['Dailyproblems/min_cool_drink_loss.py'], r'(?i)minloss|min_loss',
+           lambda n, d, rng: _ints(n, d, rng, 1, 1000),
+           _min_loss_args,
+           limits={'findMinLoss_brute_force': 16, 'find_min_loss': 500, 'findMinLoss_hashmap': 500,
+                   'findMinLoss_iterative': 2000}),
+    Family('kadane', ['algorithms/kadane_algo.py'], r'^maxsubarray_(sum|stream)',
+           lambda n, d, rng: _ints(n, d, rng, -100, 100),
+           _copy_arg, _kadane_result,
+           limits={'maxsubarray_sum_recursive': 500, 'maxsubarray_sum_memo': 500}),
+    Family('sort', ['algorithms/sorting/bubblesort.py', 'algorithms/sorting/selectionsort.py',
+                    'algorithms/sorting/insertionsort.py', 'algorithms/sorting/hybrid_sort.py',
+                    'algorithms/sorting/radix_sort.py'], r'sort$',
+           lambda n, d, rng: _ints(n, d, rng, -10 ** 6, 10 ** 6),
+           _copy_arg, _sort_result,
+           limits={'bubble_sort': 3000, 'selection_sort': 3000, 'insertionsort.insertion_sort': 3000,
+                   'hybrid_sort.insertion_sort': 3000},
+           exclude={'msd_radix_sort'}),  # strings only
+]}
+
+# --- discovery ----------------------------------------------------------------
+
+# the repo's modules are scripts: they print demos at import time and import
+# their neighbours by bare name, so they are loaded from their path with
+# their directory on sys.path and stdout swallowed
+def _load(path):
+    full = os.path.join(ROOT, path)
+    name = os.path.splitext(os.path.basename(path))[0]
+    folder = os.path.dirname(full)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    spec = importlib.util.spec_from_file_location(name, full)
+    mod = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(mod)
+    return mod
+
+# {variant name: function}; the name gets a module prefix when two files
+# define a function with the same name
+def discover(family):
+    found = []
+    for path in family.files:
+        mod = _load(path)
+        for name, fn in inspect.getmembers(mod, inspect.isfunction):
+            if fn.__module__ == mod.__name__ and not name.startswith('_') \
+                    and family.pattern.search(name) and name not in family.exclude:
+                found.append((mod.__name__, name, fn))
+    counts = {}
+    for _, name, _ in found:
+        counts[name] = counts.get(name, 0) + 1
+    return {(f"{m}.{name}" if counts[name] > 1 else name): fn for m, name, fn in found}
+
+# --- running ------------------------------------------------------------------
+
+# only fn(*args) is timed: the fresh copy of the input (setup) and turning
+# the return value into the answer (finish) happen outside the clock
+def time_variant(family, fn, inp, warmup, repeat):
+    for _ in range(warmup):
+        fn(*family.setup(fn, inp))
+    samples, res = [], None
+    for _ in range(repeat):
+        args = family.setup(fn, inp)
+        t = time.perf_counter_ns()
+        ret = fn(*args)
+        samples.append(time.perf_counter_ns() - t)
+        res = family.finish(ret, args)
+    return res, samples
+
+def run(families, sizes, dists, repeat=5, warmup=1, seed=0):
+    results, disagreements = [], []
+    for fam in families:
+        variants = discover(fam)
+        for dist in dists:
+            for n in sizes:
+                inp = fam.make_input(n, dist, random.Random(f"{seed}-{fam.name}-{dist}-{n}"))
+                reference = None
+                for vname, fn in variants.items():
+                    row = {'family': fam.name, 'variant': vname, 'n': n, 'dist': dist}
+                    if n > fam.limits.get(vname, float('inf')):
+                        continue
+                    try:
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            res, samples = time_variant(fam, fn, inp, warmup, repeat)
+                    except Exception as e:  # a variant that cannot handle this input
+                        row['error'] = f"{type(e).__name__}: {e}"
+                        results.append(row)
+                        continue
+                    if reference is None:
+                        reference = (vname, res)
+                    row['agree'] = res == reference[1]
+                    if not row['agree']:
+                        disagreements.append((fam.name, dist, n, vname, reference[0]))
+                    row.update(min_ns=min(samples), median_ns=int(statistics.median(samples)),
+                               mean_ns=int(statistics.fmean(samples)), repeat=repeat)
+                    results.append(row)
+    return results, disagreements
+
+# fastest agreeing variant for every (family, dist, n)
+def fastest(results):
+    best = {}
+    for r in results:
+        if not r.get('agree'):
+            continue
+        k = (r['family'], r['dist'], r['n'])
+        if k not in best or r['median_ns'] < best[k]['median_ns']:
+            best[k] = r
+    out = {}
+    for (fam, dist, n), r in sorted(best.items()):
+        out.setdefault(fam, {}).setdefault(dist, {})[str(n)] = r['variant']
+    return out
+
+# rows whose median is more than threshold slower than in the baseline
+def compare(results, baseline, threshold=0.10):
+    base = {(r['family'], r['variant'], r['n'], r['dist']): r for r in baseline['results'] if 'median_ns' in r}
+    regressions = []
+    for r in results:
+        b = base.get((r['family'], r['variant'], r['n'], r['dist']))
+        if b is None or 'median_ns' not in r:
+            continue
+        r['baseline_ns'] = b['median_ns']
+        r['ratio'] = round(r['median_ns'] / max(1, b['median_ns']), 3)
+        if r['ratio'] > 1 + threshold:
+            regressions.append(r)
+    return regressions
+
+def report(results):
+    for r in results:
+        if 'error' in r:
+            print(f"{r['family']:<20} {r['dist']:<10} {r['n']:>8} {r['variant']:<32} {r['error']}")
+            continue
+        extra = f"  x{r['ratio']:.2f} vs baseline" if 'ratio' in r else ''
+        flag = '' if r['agree'] else '  DISAGREES'
+        print(f"{r['family']:<20} {r['dist']:<10} {r['n']:>8} {r['variant']:<32} "
+              f"{r['median_ns'] / 1e6:>10.3f} ms{extra}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark and cross check the algorithm variants of the repo')
+    parser.add_argument('--family', action='append', choices=sorted(FAMILIES), help='family to run (repeatable), default all')
+    parser.add_argument('--sizes', default='100,1000', help='comma separated input sizes')
+    parser.add_argument('--dist', default='random', help=f"comma separated distributions out of {','.join(DISTS)}")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='JSON file from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown vs baseline (0.10 = 10%%)')
+    parser.add_argument('--list', action='store_true', help='only list the discovered variants')
+    args = parser.parse_args(argv)
+
+    families = [FAMILIES[f] for f in (args.family or sorted(FAMILIES))]
+    if args.list:
+        for fam in families:
+            print(fam.name, ', '.join(discover(fam)))
+        return 0
+    dists = args.dist.split(',')
+    for d in dists:
+        if d not in DISTS:
+            parser.error(f"unknown distribution {d}")
+    sizes = [int(s) for s in args.sizes.split(',')]
+
+    results, disagreements = run(families, sizes, dists, args.repeat, args.warmup, args.seed)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    report(results)
+
+    doc = {
+        'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'seed': args.seed,
+                 'repeat': args.repeat, 'warmup': args.warmup},
+        'results': results,
+        'fastest': fastest(results),
+        'regressions': [(r['family'], r['variant'], r['n'], r['dist'], r['ratio']) for r in regressions],
+        'disagreements': disagreements,
+    }
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(doc, f, indent=1)
+    for d in disagreements:
+        print("disagreement: {} {} n={} {} != {}".format(*d))
+    for r in regressions:
+        print(f"regression: {r['family']} {r['variant']} n={r['n']} {r['dist']} x{r['ratio']:.2f}")
+    return 1 if disagreements or regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
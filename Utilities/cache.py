@@ -0,0 +1,319 @@
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import wraps
+
+# Bounded memo caches, a drop in for the `memo = {}` dicts and lru_cache(None)
+# used by the recursive solutions (min_cool_drink_loss.py, kadane_algo.py).
+#
+#   LRUCache(maxsize)       evicts the least recently used entry
+#   LFUCache(maxsize)       evicts the least frequently used (LRU among ties), O(1)
+#   TTLCache(ttl, maxsize)  LRU, and entries expire ttl seconds after being stored
+#
+# Every cache takes maxsize (entries) and / or maxbytes (sizeof(key) +
+# sizeof(value), sys.getsizeof by default: shallow, containers are not walked)
+# and counts hits, misses, evictions and expirations (stats()).
+# All operations hold the cache's lock, so a cache can be shared by threads.
+#
+#   @memoize(LRUCache(100_000), packed=True)    # f(i, j) keyed by pack(i, j)
+#   def f(i, j): ...
+#
+# pack(i, j) folds small non negative ints into one int key: one int object
+# instead of a tuple of them per lookup, and a smaller dict entry. The key
+# starts with a 1 bit above the values, so the number of values is part of
+# it (pack(1) != pack(0, 1)); values outside [0, 2**bits) are a ValueError.
+
+def pack(*vals, bits=32):
+    key, limit = 1, 1 << bits
+    for v in vals:
+        if not 0 <= v < limit:
+            raise ValueError(f"{v} does not fit in {bits} bits")
+        key = (key << bits) | v
+    return key
+
+def unpack(key, bits=32):
+    mask = (1 << bits) - 1
+    out = []
+    while key > 1:
+        out.append(key & mask)
+        key >>= bits
+    return tuple(reversed(out))
+
+_MISSING = object()
+
+class Cache(ABC):
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=sys.getsizeof):
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize, self.maxbytes, self.sizeof = maxsize, maxbytes, sizeof
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._lock = threading.Lock()
+
+    # subclasses keep the entries and implement these (called with the lock held)
+    @abstractmethod
+    def _lookup(self, key):
+        ...  # value of key or _MISSING, counts as a use (recency, frequency)
+
+    @abstractmethod
+    def _has(self, key):
+        ...  # key is stored and live, not counted as a use
+
+    @abstractmethod
+    def _store(self, key, value, size):
+        ...  # add a new entry
+
+    @abstractmethod
+    def _remove(self, key):
+        ...  # drop key, its size or None if it was not there
+
+    @abstractmethod
+    def _victim(self):
+        ...  # the key to evict next
+
+    @abstractmethod
+    def __len__(self):
+        ...  # number of entries
+
+    def _entry_size(self, key, value):
+        return self.sizeof(key) + self.sizeof(value) if self.maxbytes is not None else 0
+
+    # evict until an entry of `size` bytes fits
+    def _make_room(self, size):
+        while len(self) and ((self.maxsize is not None and len(self) >= self.maxsize) or
+                             (self.maxbytes is not None and self.bytes + size > self.maxbytes)):
+            self.bytes -= self._remove(self._victim())
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    # a membership test does not touch recency / frequency or the counters
+    def __contains__(self, key):
+        with self._lock:
+            return self._has(key)
+
+    # an entry bigger than maxbytes on its own is not stored
+    def put(self, key, value):
+        size = self._entry_size(key, value)
+        with self._lock:
+            old = self._remove(key)
+            if old is not None:
+                self.bytes -= old
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._make_room(size)
+            self._store(key, value, size)
+            self.bytes += size
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                return default
+            self.bytes -= self._remove(key)
+            return value
+
+    def clear(self):
+        with self._lock:
+            while len(self):
+                self._remove(self._victim())
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {'size': len(self), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / total if total else 0.0,
+                    'evictions': self.evictions, 'expirations': self.expirations}
+
+
+class LRUCache(Cache):
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=sys.getsizeof):
+        super().__init__(maxsize, maxbytes, sizeof)
+        self._data = OrderedDict()  # key -> (value, size), least recent first
+
+    def _lookup(self, key):
+        e = self._data.get(key)
+        if e is None:
+            return _MISSING
+        self._data.move_to_end(key)
+        return e[0]
+
+    def _has(self, key):
+        return key in self._data
+
+    def _store(self, key, value, size):
+        self._data[key] = (value, size)
+
+    def _remove(self, key):
+        e = self._data.pop(key, None)
+        return None if e is None else e[1]
+
+    def _victim(self):
+        return next(iter(self._data))
+
+    def __len__(self):
+        return len(self._data)
+
+
+# keys are grouped by use count: freq -> OrderedDict of keys (oldest first),
+# and min_freq is the lowest non empty group, so hit / insert / evict are O(1)
+class LFUCache(Cache):
+    def __init__(self, maxsize=None, maxbytes=None, sizeof=sys.getsizeof):
+        super().__init__(maxsize, maxbytes, sizeof)
+        self._data = {}        # key -> [value, size, freq]
+        self._freqs = {}       # freq -> OrderedDict(key -> None)
+        self._min_freq = 0
+
+    def _touch(self, key, e):
+        f = e[2]
+        group = self._freqs[f]
+        del group[key]
+        if not group:
+            del self._freqs[f]
+            if self._min_freq == f:
+                self._min_freq = f + 1
+        e[2] = f + 1
+        self._freqs.setdefault(f + 1, OrderedDict())[key] = None
+
+    def _lookup(self, key):
+        e = self._data.get(key)
+        if e is None:
+            return _MISSING
+        self._touch(key, e)
+        return e[0]
+
+    def _has(self, key):
+        return key in self._data
+
+    def _store(self, key, value, size):
+        self._data[key] = [value, size, 1]
+        self._freqs.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+
+    def _remove(self, key):
+        e = self._data.pop(key, None)
+        if e is None:
+            return None
+        group = self._freqs[e[2]]
+        del group[key]
+        if not group:
+            del self._freqs[e[2]]
+            if self._min_freq == e[2]:
+                self._min_freq = min(self._freqs, default=0)  # only on the last key of the lowest group
+        return e[1]
+
+    def _victim(self):
+        return next(iter(self._freqs[self._min_freq]))
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    def __init__(self, ttl, maxsize=None, maxbytes=None, sizeof=sys.getsizeof, timer=time.monotonic):
+        super().__init__(maxsize, maxbytes, sizeof)
+        self.ttl, self.timer = ttl, timer
+        self._expires = {}
+
+    def _lookup(self, key):
+        exp = self._expires.get(key)
+        if exp is not None and exp <= self.timer():
+            self.bytes -= self._remove(key)
+            self.expirations += 1
+            return _MISSING
+        return super()._lookup(key)
+
+    # an expired entry is reported missing but left for the next lookup / expire()
+    def _has(self, key):
+        exp = self._expires.get(key)
+        return exp is not None and exp > self.timer()
+
+    def _store(self, key, value, size):
+        super()._store(key, value, size)
+        self._expires[key] = self.timer() + self.ttl
+
+    def _remove(self, key):
+        self._expires.pop(key, None)
+        return super()._remove(key)
+
+    # drop everything already expired. _expires is in store order (put removes
+    # the key first), which is expiry order, while _data is in use order.
+    def expire(self):
+        with self._lock:
+            now = self.timer()
+            while self._expires:
+                key = next(iter(self._expires))
+                if self._expires[key] > now:
+                    break
+                self.bytes -= self._remove(key)
+                self.expirations += 1
+
+
+# decorator: results of fn kept in `cache` (default an unbounded LRUCache).
+# key(*args) builds the cache key; packed=True uses pack(*args) (non negative
+# int arguments below 2**32, ValueError otherwise), else the argument itself
+# or the args tuple.
+# The value is computed outside the lock, two threads missing on the same key
+# may both compute it.
+def memoize(cache=None, key=None, packed=False):
+    cache = cache if cache is not None else LRUCache()
+    if key is None:
+        key = pack if packed else (lambda *args: args[0] if len(args) == 1 else args)
+
+    def deco(fn):
+        @wraps(fn)
+        def wrapper(*args):
+            k = key(*args)
+            value = cache.get(k, _MISSING)
+            if value is _MISSING:
+                value = fn(*args)
+                cache.put(k, value)
+            return value
+        wrapper.cache = cache
+        return wrapper
+    return deco
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(10000)
+    A = list(range(1, 1001))
+    N = len(A)
+
+    # min_cool_drink_loss's recursive dp with a bounded, packed key cache
+    # (drinks left..end-1 still to sell, end exclusive so keys stay >= 0)
+    @memoize(LRUCache(maxsize=600_000), packed=True)
+    def loss(left, end):
+        if left >= end:
+            return 0
+        day = N - (end - 1 - left)
+        return min(day * A[left] + loss(left + 1, end), day * A[end - 1] + loss(left, end - 1))
+
+    print(loss(0, N), loss.cache.stats())
+
+    lfu = LFUCache(maxsize=2)
+    lfu.put('a', 1); lfu.get('a'); lfu.put('b', 2); lfu.put('c', 3)   # 'b' is evicted
+    print(sorted(k for k in 'abc' if k in lfu), lfu.stats())
+
+    ttl = TTLCache(ttl=0.05, maxbytes=10_000)
+    ttl['x'] = 'value'
+    time.sleep(0.06)
+    print(ttl.get('x'), ttl.stats())
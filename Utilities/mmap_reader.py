@@ -0,0 +1,159 @@
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Reading big files without loading them: the file is memory mapped and
+# records come out as memoryview slices of the mapping, so nothing is copied
+# and the OS pages data in (and drops it again) as the scan moves on.
+#
+#   with MappedFile('big.log') as f:
+#       for line in f.lines(): ...          # memoryview, no b'\n'
+#       for rec in f.records(16): ...       # fixed size records
+#       for rec in f.split(b'\x1e'): ...    # any delimiter
+#   for chunk in chunks('big.log', 1 << 20): ...   # bytes, whole lines only
+#   parallel_map('big.log', count_lines)    # one slice of the file per process
+#
+# Slices are only valid while the file is open: keep bytes(view) for anything
+# that has to outlive it. int(), bytes.split, hashlib, array.frombytes ... all
+# take a memoryview directly.
+
+class MappedFile:
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, 'rb')
+        self.size = os.fstat(self._f.fileno()).st_size
+        # a zero length file cannot be mapped
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        if self._mm is not None and hasattr(self._mm, 'madvise'):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        self.buf = memoryview(self._mm) if self._mm is not None else memoryview(b'')
+
+    def __len__(self):
+        return self.size
+
+    # records separated by delim in [start, end); the delimiter is not part of
+    # the record, a missing delimiter after the last record is fine
+    def split(self, delim=b'\n', start=0, end=None, keepends=False):
+        end = self.size if end is None else end
+        if self._mm is None:
+            return
+        find, buf, k = self._mm.find, self.buf, len(delim)
+        pos = start
+        while pos < end:
+            nxt = find(delim, pos, end)
+            if nxt < 0:
+                yield buf[pos:end]
+                return
+            yield buf[pos:nxt + k] if keepends else buf[pos:nxt]
+            pos = nxt + k
+
+    def lines(self, start=0, end=None, keepends=False):
+        return self.split(b'\n', start, end, keepends)
+
+    # fixed size records; a short record at the end is an error unless partial=True
+    def records(self, size, start=0, end=None, partial=False):
+        end = self.size if end is None else end
+        if (end - start) % size and not partial:
+            raise ValueError(f"{end - start} bytes is not a multiple of the record size {size}")
+        for pos in range(start, end, size):
+            yield self.buf[pos:min(pos + size, end)]
+
+    # `parts` (start, end) ranges covering the file, every cut right after a delim
+    # (delim=None: cut anywhere, multiple of record_size bytes)
+    def boundaries(self, parts, delim=b'\n', record_size=1):
+        cuts = [0]
+        for i in range(1, parts):
+            pos = self.size * i // parts
+            if delim is None:
+                pos -= pos % record_size
+            elif pos > cuts[-1]:
+                nxt = self._mm.find(delim, pos - 1) if self._mm is not None else -1
+                pos = self.size if nxt < 0 else nxt + len(delim)
+            cuts.append(max(pos, cuts[-1]))
+        cuts.append(self.size)
+        return [(a, b) for a, b in zip(cuts, cuts[1:]) if b > a]
+
+    def close(self):
+        self.buf.release()
+        if self._mm is not None:
+            try:
+                self._mm.close()
+            except BufferError:  # slices still alive, unmapped when the last one goes
+                pass
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# plain buffered reads of about block_size bytes. With a delimiter every chunk
+# ends right after one (the partial record is carried over to the next chunk);
+# delim=None gives raw blocks.
+def chunks(path, block_size=1 << 20, delim=b'\n'):
+    with open(path, 'rb', buffering=0) as f:
+        carry = b''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                if carry:
+                    yield carry
+                return
+            if delim is None:
+                yield block
+                continue
+            block = carry + block
+            cut = block.rfind(delim)
+            if cut < 0:
+                carry = block
+                continue
+            cut += len(delim)
+            carry = block[cut:]
+            yield block[:cut]
+
+
+def _map_part(path, fn, start, end):
+    with MappedFile(path) as f:
+        return fn(f.buf[start:end])
+
+# splits the file in `workers` ranges at record boundaries and runs
+# fn(memoryview of the range) in a process per range; results in file order.
+# fn has to be a module level function (it is pickled) and must not keep the view.
+def parallel_map(path, fn, workers=None, delim=b'\n', record_size=1):
+    workers = workers or os.cpu_count() or 1
+    with MappedFile(path) as f:
+        parts = f.boundaries(workers, delim, record_size)
+    if len(parts) <= 1:
+        return [_map_part(path, fn, a, b) for a, b in parts]
+    with ProcessPoolExecutor(len(parts)) as ex:
+        futures = [ex.submit(_map_part, path, fn, a, b) for a, b in parts]
+        return [fu.result() for fu in futures]
+
+
+# worker functions for parallel_map
+def count_lines(view, block=1 << 20):
+    return sum(view[i:i + block].tobytes().count(b'\n') for i in range(0, len(view), block))
+
+# whitespace separated ints (copies the worker's share once to split it)
+def sum_ints(view):
+    return sum(int(tok) for tok in view.tobytes().split())
+
+
+if __name__ == "__main__":
+    import sys, tempfile
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'algorithms'))
+    from kadane_algo import OnlineKadane
+
+    path = os.path.join(tempfile.mkdtemp(), 'numbers.txt')
+    with open(path, 'w') as out:
+        out.write('\n'.join(str(x) for x in [2, 3, -8, 7, -1, 2, 3, -20, 4]) + '\n')
+    with MappedFile(path) as f:
+        print([bytes(l) for l in f.lines()][:4])
+        # max subarray straight from disk, one number per line
+        print(OnlineKadane().feed(int(l) for l in f.lines()).result())
+        print(f.boundaries(3))
+    print([c for c in chunks(path, 8)])
+    print(parallel_map(path, count_lines, 2), parallel_map(path, sum_ints, 2))
@@ -1,3 +1,4 @@
+from itertools import islice
 # if positive extend else restart --> kadanes algorithm
 def maxsubarray(arr):
     currmax = arr[0]
@@ -39,13 +40,16 @@ def maxsubarray_sum_recursive(arr):
         return curr_max_end, overall_max
 
     _, res = helper(len(arr) - 1)
+    return res
 
-def maxsubarray_sum_memo(arr):
-    memo = {}
+# memo: {} by default, or a bounded cache from Utilities/cache.py (LRUCache...)
+def maxsubarray_sum_memo(arr, memo=None):
+    memo = {} if memo is None else memo
 
     def helper(i):
-        if i in memo:
-            return memo[i]
+        res = memo.get(i)
+        if res is not None:
+            return res
         if i == 0:
             memo[i] = (arr[0], arr[0])
             return memo[i]
@@ -56,6 +60,7 @@ def maxsubarray_sum_memo(arr):
         return memo[i]
 
     _, res = helper(len(arr) - 1)
+    return res
 
 def maxsubarray_sum_dp(arr):
     n = len(arr)
@@ -65,8 +70,7 @@ def maxsubarray_sum_dp(arr):
     for i in range(1, n):
         dp[i] = max(arr[i], dp[i - 1] + arr[i])
         res = max(res, dp[i])
-
-
+    return res
 
 def maxsubarray_sum_kadane(arr):
     max_so_far = arr[0]
@@ -78,8 +82,118 @@ def maxsubarray_sum_kadane(arr):
     
     return max_so_far
 
+# online kadane: the numbers are fed chunk by chunk (a list, array, a slice
+# of a file...), only the running state is kept -> O(1) memory whatever the
+# length of the stream. Same tie rules as maxsubarray: restart when the
+# running sum went negative, keep the earliest best segment.
+class OnlineKadane:
+    def __init__(self):
+        self.n = 0                      # numbers seen so far
+        self.currmax, self.currstart = 0, 0
+        self.best, self.beststart, self.bestend = float('-inf'), -1, -1
+
+    def feed(self, chunk):
+        currmax, currstart = self.currmax, self.currstart
+        best, bs, be = self.best, self.beststart, self.bestend
+        i = self.n
+        for x in chunk:
+            if currmax < 0:
+                currmax, currstart = x, i
+            else:
+                currmax += x
+            if currmax > best:
+                best, bs, be = currmax, currstart, i
+            i += 1
+        self.n = i
+        self.currmax, self.currstart = currmax, currstart
+        self.best, self.beststart, self.bestend = best, bs, be
+        return self
+
+    # (best sum, start index, end index), indices are inclusive
+    def result(self):
+        return self.best, self.beststart, self.bestend
+
+def maxsubarray_stream(numbers, chunk_size=1 << 16):
+    it = iter(numbers)
+    k = OnlineKadane()
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return k.result()
+        k.feed(chunk)
+
+
+# segment tree answering "max subarray sum inside arr[l..r]" in O(logn)
+# with O(logn) point updates. Every node keeps 4 values of its range:
+# total sum, best prefix, best suffix, best subarray; two neighbouring
+# ranges combine in O(1) (best = left best | right best | left suffix + right prefix)
+class MaxSubarraySegmentTree:
+    NEG = float('-inf')
+
+    def __init__(self, arr):
+        self.n = len(arr)
+        size = 1
+        while size < self.n:
+            size *= 2
+        self.size = size
+        # leaves at [size, 2*size), padding leaves are empty ranges
+        self.tot = [0] * (2 * size)
+        self.pre = [self.NEG] * (2 * size)
+        self.suf = [self.NEG] * (2 * size)
+        self.best = [self.NEG] * (2 * size)
+        for i, x in enumerate(arr):
+            j = size + i
+            self.tot[j] = self.pre[j] = self.suf[j] = self.best[j] = x
+        for i in range(size - 1, 0, -1):
+            self._pull(i)
+
+    def _pull(self, i):
+        l, r = 2 * i, 2 * i + 1
+        self.tot[i], self.pre[i], self.suf[i], self.best[i] = self._combine(
+            (self.tot[l], self.pre[l], self.suf[l], self.best[l]),
+            (self.tot[r], self.pre[r], self.suf[r], self.best[r]))
+
+    @staticmethod
+    def _combine(a, b):
+        return (a[0] + b[0], max(a[1], a[0] + b[1]), max(b[2], b[0] + a[2]),
+                max(a[3], b[3], a[2] + b[1]))
+
+    def update(self, i, x):
+        j = self.size + i
+        self.tot[j] = self.pre[j] = self.suf[j] = self.best[j] = x
+        j //= 2
+        while j:
+            self._pull(j)
+            j //= 2
+
+    # max subarray sum fully inside arr[l..r] (inclusive)
+    def query(self, l, r):
+        if not 0 <= l <= r < self.n:
+            raise IndexError("query range out of bounds")
+        empty = (0, self.NEG, self.NEG, self.NEG)
+        left, right = empty, empty  # pieces collected from both ends
+        l += self.size
+        r += self.size + 1
+        while l < r:
+            if l & 1:
+                left = self._combine(left, (self.tot[l], self.pre[l], self.suf[l], self.best[l]))
+                l += 1
+            if r & 1:
+                r -= 1
+                right = self._combine((self.tot[r], self.pre[r], self.suf[r], self.best[r]), right)
+            l //= 2
+            r //= 2
+        return self._combine(left, right)[3]
+
 if __name__=="__main__":
     
     arr =[ 2, 3, -8, 7, -1, 2, 3]
     
-    print(maxsubarray_sum(arr))
\ No newline at end of file
+    print(maxsubarray_sum(arr))
+    print(maxsubarray_sum_dp(arr), maxsubarray_sum_memo(arr), maxsubarray_sum_recursive(arr))
+    print(maxsubarray_stream(iter(arr), chunk_size=3))
+
+    st = MaxSubarraySegmentTree(arr)
+    print(st.query(0, 6), st.query(0, 2))
+    st.update(2, 8)
+    print(st.query(0, 6))
\ No newline at end of file
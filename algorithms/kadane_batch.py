@@ -0,0 +1,70 @@
+from array import array
+from kadane_algo import OnlineKadane
+
+try:
+    import numpy as np
+except ImportError:  # pure python kadane per series is used instead
+    np = None
+
+# max subarray for many independent series at once (one series per row)
+# returns (sums, starts, ends), ends inclusive, same answers as OnlineKadane.
+#
+# prefix sums turn it into reductions over whole rows:
+#   P[j] = a[0] + ... + a[j-1]           (P[0] = 0)
+#   best segment ending at j = P[j+1] - min(P[0..j])
+# -> np.cumsum + np.minimum.accumulate + argmax, no per element python loop.
+# rows are processed block_rows at a time to bound the temporary arrays.
+# series of different lengths (not a 2-D array) go through the python path.
+def max_subarray_batch(series, block_rows=4096):
+    if np is None:
+        return _batch_py(series)
+    try:
+        a = np.asarray(series)
+    except ValueError:  # ragged rows
+        return _batch_py(series)
+    if a.ndim != 2 or a.shape[1] == 0:
+        raise ValueError("expected a 2-D array with at least one column")
+    dtype = np.float64 if a.dtype.kind == 'f' else np.int64
+    m = a.shape[0]
+    sums = np.empty(m, dtype=dtype)
+    starts = np.empty(m, dtype=np.int64)
+    ends = np.empty(m, dtype=np.int64)
+    for lo in range(0, m, block_rows):
+        hi = min(lo + block_rows, m)
+        sums[lo:hi], starts[lo:hi], ends[lo:hi] = _block_np(a[lo:hi], dtype)
+    return sums, starts, ends
+
+def _block_np(a, dtype):
+    rows, n = a.shape
+    P = np.zeros((rows, n + 1), dtype=dtype)
+    np.cumsum(a, axis=1, dtype=dtype, out=P[:, 1:])
+    runmin = np.minimum.accumulate(P[:, :-1], axis=1)
+    cand = P[:, 1:] - runmin
+    r = np.arange(rows)
+    end = cand.argmax(axis=1)           # first (earliest) best end
+    low = runmin[r, end]
+    start = (P[:, :-1] == low[:, None]).argmax(axis=1)  # first index reaching that minimum
+    return cand[r, end], start, end
+
+def _batch_py(series):
+    sums, starts, ends = [], array('q'), array('q')
+    for row in series:
+        if not len(row):
+            raise ValueError("every series needs at least one value")
+        best, s, e = OnlineKadane().feed(row).result()
+        sums.append(best)
+        starts.append(s)
+        ends.append(e)
+    return sums, starts, ends
+
+
+if __name__ == "__main__":
+    series = [[2, 3, -8, 7, -1, 2, 3],
+              [-35, 2, 9, -10, 11],
+              [-3, -1, -2, -4, -5]]
+    print(max_subarray_batch(series))
+    series = [[2, 3, -8, 7, -1, 2, 3],
+              [-35, 2, 9, -10, 11, 0, 0],
+              [-3, -1, -2, -4, -5, -9, -9]]
+    sums, starts, ends = max_subarray_batch(series)
+    print(sums, starts, ends)
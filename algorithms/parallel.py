@@ -0,0 +1,258 @@
+import operator
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from heapq import merge
+from itertools import accumulate
+from math import gcd
+from multiprocessing import shared_memory
+
+from kadane_algo import MaxSubarraySegmentTree
+
+try:
+    import numpy as np
+except ImportError:  # workers fall back to python loops over the shared buffer
+    np = None
+
+# Multi core versions of sort / reduce / prefix sums.
+#
+# The data is copied once into a shared memory block (SharedArray); worker
+# processes attach to it by name and read / write their slice in place, so
+# only (name, typecode, n, lo, hi) and small results are pickled, never the
+# array itself.
+#
+#   parallel_sort(a)               every worker sorts one slice, then the
+#                                  slices are split by p-1 sampled pivots and
+#                                  every worker merges the pieces of one
+#                                  value range into its place in the output
+#   parallel_reduce(a, op)         op: 'sum', 'min', 'max', 'gcd',
+#                                  'max_subarray' or (chunk_fn, combine_fn)
+#   parallel_prefix_sum(a)         local prefix sums, then every slice adds
+#                                  the total of the slices before it
+#
+# a is an array.array, a 1-D numpy array or a list of ints / floats.
+# workers=None uses every core; workers=1 (or a small input) runs in process.
+
+MIN_PER_WORKER = 1 << 14
+
+class SharedArray:
+    def __init__(self, typecode, n, name=None):
+        self.typecode, self.n = typecode, n
+        nbytes = n * array(typecode).itemsize
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.raw = self.shm.buf[:nbytes]
+        self.buf = self.raw.cast(typecode)
+
+    @classmethod
+    def from_seq(cls, a):
+        if np is not None and isinstance(a, np.ndarray):
+            a = np.ascontiguousarray(a)
+            tc = a.dtype.char
+        elif isinstance(a, array):
+            tc = a.typecode
+        else:
+            tc = 'q' if all(isinstance(x, int) for x in a) else 'd'
+            a = array(tc, a)
+        s = cls(tc, len(a))
+        s.raw[:] = memoryview(a).cast('B')
+        return s
+
+    @classmethod
+    def attach(cls, handle):
+        name, typecode, n = handle
+        return cls(typecode, n, name)
+
+    @property
+    def handle(self):
+        return self.shm.name, self.typecode, self.n
+
+    # numpy view of buf[lo:hi] when numpy is there, else the memoryview slice
+    def view(self, lo=0, hi=None):
+        v = self.buf[lo:hi]
+        return np.frombuffer(v, dtype=self.typecode) if np is not None else v
+
+    # write the contents back into a (same length, same element type)
+    def copy_to(self, a):
+        if np is not None and isinstance(a, np.ndarray):
+            a[...] = np.frombuffer(self.raw, dtype=self.typecode)
+        elif isinstance(a, array):
+            memoryview(a).cast('B')[:] = self.raw
+        else:
+            a[:] = self.buf.tolist()
+        return a
+
+    def to_array(self):
+        if np is not None:
+            return np.frombuffer(self.raw, dtype=self.typecode).copy()
+        out = array(self.typecode)
+        out.frombytes(self.raw)
+        return out
+
+    def close(self):
+        self.buf.release()
+        self.raw.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class _Serial:
+    def map(self, fn, *iterables):
+        return map(fn, *iterables)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+def _executor(n, workers):
+    p = workers or os.cpu_count() or 1
+    p = max(1, min(p, n // MIN_PER_WORKER))
+    return p, (ProcessPoolExecutor(p) if p > 1 else _Serial())
+
+def _bounds(n, parts):
+    return [(n * i // parts, n * (i + 1) // parts) for i in range(parts)]
+
+# --- sort -------------------------------------------------------------------
+
+def _sort_part(handle, lo, hi):
+    with SharedArray.attach(handle) as s:
+        v = s.view(lo, hi)
+        if np is not None:
+            v.sort()
+        else:
+            v[:] = array(s.typecode, sorted(v))
+        del v
+
+def _merge_part(src, dst, pieces, off):
+    with SharedArray.attach(src) as s, SharedArray.attach(dst) as d:
+        size = sum(hi - lo for lo, hi in pieces)
+        out = d.view(off, off + size)
+        if np is not None:  # the pieces are sorted runs, a stable sort merges them
+            out[:] = np.sort(np.concatenate([s.view(lo, hi) for lo, hi in pieces]), kind='stable')
+        else:
+            out[:] = array(s.typecode, merge(*(s.buf[lo:hi] for lo, hi in pieces)))
+        del out
+
+def parallel_sort(a, workers=None):
+    n = len(a)
+    p, ex = _executor(n, workers)
+    with SharedArray.from_seq(a) as src, SharedArray(src.typecode, n) as dst, ex:
+        parts = _bounds(n, p)
+        list(ex.map(_sort_part, [src.handle] * p, *zip(*parts)))
+        # p-1 pivots from p evenly spaced samples of every sorted slice
+        samples = sorted(src.buf[lo + (hi - lo) * i // p] for lo, hi in parts if hi > lo for i in range(p))
+        pivots = [samples[len(samples) * k // p] for k in range(1, p)]
+        # cuts[j][i]..cuts[j][i+1]: the part of slice j that goes to bucket i
+        cuts = [[lo] + [bisect_right(src.buf, x, lo, hi) for x in pivots] + [hi] for lo, hi in parts]
+        jobs, off = [], 0
+        for i in range(p):
+            pieces = [(c[i], c[i + 1]) for c in cuts if c[i + 1] > c[i]]
+            jobs.append((pieces, off))
+            off += sum(hi - lo for lo, hi in pieces)
+        list(ex.map(_merge_part, [src.handle] * p, [dst.handle] * p, *zip(*jobs)))
+        return dst.copy_to(a)
+
+# --- reduce -----------------------------------------------------------------
+
+# (total, best prefix, best suffix, best subarray) of one chunk, the same
+# summary MaxSubarraySegmentTree keeps per node; cur (best sum ending at
+# the current element) is the best suffix once the chunk is done
+def _kadane_summary(v):
+    tot, pre, cur, best = 0, float('-inf'), 0, float('-inf')
+    for x in v:
+        tot += x
+        pre = max(pre, tot)
+        cur = max(x, cur + x)
+        best = max(best, cur)
+    return tot, pre, cur, best
+
+def _gcd_chunk(v):
+    return gcd(*v)
+
+# op -> (value of one chunk, combine two neighbouring chunk values)
+# combine has to be associative, chunks are combined left to right
+REDUCERS = {
+    'sum': (sum, operator.add),
+    'min': (min, min),
+    'max': (max, max),
+    'gcd': (_gcd_chunk, gcd),
+    'max_subarray': (_kadane_summary, MaxSubarraySegmentTree._combine),
+}
+
+def _reduce_part(handle, lo, hi, chunk_fn):
+    with SharedArray.attach(handle) as s:
+        v = s.buf[lo:hi]
+        res = chunk_fn(v)
+        v.release()
+        return res
+
+def parallel_reduce(a, op='sum', workers=None):
+    if not len(a):
+        raise ValueError("reduce of an empty sequence")
+    chunk_fn, combine = REDUCERS[op] if isinstance(op, str) else op
+    p, ex = _executor(len(a), workers)
+    with SharedArray.from_seq(a) as s, ex:
+        parts = _bounds(len(a), p)
+        res = reduce(combine, ex.map(_reduce_part, [s.handle] * p, *zip(*parts), [chunk_fn] * p))
+    return res[3] if op == 'max_subarray' else res
+
+# --- prefix sums ------------------------------------------------------------
+
+def _prefix_part(handle, lo, hi):
+    with SharedArray.attach(handle) as s:
+        v = s.view(lo, hi)
+        if np is not None:
+            np.cumsum(v, out=v)
+        else:
+            v[:] = array(s.typecode, accumulate(v))
+        del v
+        return s.buf[hi - 1] if hi > lo else 0
+
+def _shift_part(handle, lo, hi, delta):
+    with SharedArray.attach(handle) as s:
+        v = s.view(lo, hi)
+        if np is not None:
+            v += delta
+        else:
+            v[:] = array(s.typecode, (x + delta for x in v))
+        del v
+
+# inclusive prefix sums out[i] = a[0] + ... + a[i], as a new array of the same type
+def parallel_prefix_sum(a, workers=None):
+    n = len(a)
+    p, ex = _executor(n, workers)
+    with SharedArray.from_seq(a) as s, ex:
+        parts = _bounds(n, p)
+        totals = list(ex.map(_prefix_part, [s.handle] * p, *zip(*parts)))
+        offsets = list(accumulate(totals[:-1]))
+        if offsets:
+            list(ex.map(_shift_part, [s.handle] * (p - 1), *zip(*parts[1:]), offsets))
+        return s.to_array()
+
+
+if __name__ == "__main__":
+    import random, time
+    data = array('q', (random.randrange(-10 ** 6, 10 ** 6) for _ in range(1 << 20)))
+    t = time.perf_counter()
+    srt = parallel_sort(array('q', data))
+    print("sort", time.perf_counter() - t, list(srt) == sorted(data))
+    print("sum", parallel_reduce(data), sum(data))
+    print("max_subarray", parallel_reduce(data, 'max_subarray'))
+    print("gcd", parallel_reduce(array('q', [84, 126, 210, 462] * 10000), 'gcd'))
+    pre = parallel_prefix_sum(data)
+    print("prefix", pre[-1] == sum(data))
@@ -0,0 +1,161 @@
+import argparse
+import heapq
+import io
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# External merge sort: sorts a text file (one record per line) that does not
+# fit in memory.
+#
+#  1. run generation: read about `memory` bytes of whole lines at a time,
+#     sort them in memory and spill each sorted chunk ("run") to a temp file.
+#     With workers > 1 the chunks are sorted and written by a process pool
+#     while the main process keeps reading.
+#  2. k-way merge: heapq.merge keeps one line per run in a heap, so the merge
+#     holds k lines (plus the file buffers) no matter how big the input is.
+#     If there are more runs than fan_in, groups of fan_in runs are merged
+#     into bigger runs first (fewer open files, bigger sequential reads).
+#
+# Lines are handled as bytes, so any encoding works and nothing is decoded
+# unless a numeric key is asked for. Runs are merged in input order and
+# list.sort / heapq.merge are both stable, so equal keys keep their order.
+#
+#   python external_sort.py big.log -o sorted.log --memory 4G --workers 8
+#   python external_sort.py big.log --key-field 0 --numeric   # by ns timestamp
+
+def parse_size(s):
+    units = {'k': 1 << 10, 'm': 1 << 20, 'g': 1 << 30, 't': 1 << 40}
+    s = s.strip().lower().rstrip('b')
+    if s and s[-1] in units:
+        return int(float(s[:-1]) * units[s[-1]])
+    return int(s)
+
+def _number(s):
+    try:
+        return int(s)
+    except ValueError:
+        return float(s)
+
+# key for a line, built from plain values so it can be sent to worker processes.
+# field: sort by the field-th whitespace separated field instead of the whole line.
+# numeric: compare that field as a number; lines where it is not a number
+# come first, in their original order.
+def make_key(field=None, numeric=False):
+    if field is None and not numeric:
+        return None
+    def key(line):
+        s = line
+        if field is not None:
+            parts = line.split(None, field + 1)
+            s = parts[field] if field < len(parts) else b''
+        if not numeric:
+            return s
+        try:
+            return (1, _number(s))
+        except ValueError:
+            return (0, 0)
+    return key
+
+# sort one chunk of lines and write it as a run file, returns the file name
+def _sort_run(data, tmpdir, field, numeric, reverse):
+    lines = io.BytesIO(data).readlines()  # split on b'\n' only
+    if lines and not lines[-1].endswith(b'\n'):
+        lines[-1] += b'\n'
+    lines.sort(key=make_key(field, numeric), reverse=reverse)
+    fd, path = tempfile.mkstemp(prefix='run', suffix='.txt', dir=tmpdir)
+    with os.fdopen(fd, 'wb') as f:
+        f.writelines(lines)
+    return path
+
+# chunks of about `size` bytes, always cut after a newline
+def _chunks(f, size):
+    while True:
+        data = f.read(size)
+        if not data:
+            return
+        if not data.endswith(b'\n'):
+            data += f.readline()
+        yield data
+
+def _merge(paths, out, key, reverse, buf):
+    files = [open(p, 'rb', buffering=buf) for p in paths]
+    try:
+        out.writelines(heapq.merge(*files, key=key, reverse=reverse))
+    finally:
+        for f in files:
+            f.close()
+
+def _merge_runs(runs, out, key, reverse, memory, fan_in, tmpdir):
+    while len(runs) > fan_in:  # merge passes until one final merge is enough
+        merged = []
+        for i in range(0, len(runs), fan_in):
+            group = runs[i:i + fan_in]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+            fd, path = tempfile.mkstemp(prefix='run', suffix='.txt', dir=tmpdir)
+            with os.fdopen(fd, 'wb', buffering=memory // (len(group) + 1)) as f:
+                _merge(group, f, key, reverse, memory // (len(group) + 1))
+            for p in group:
+                os.remove(p)
+            merged.append(path)
+        runs = merged
+    _merge(runs, out, key, reverse, max(1 << 16, memory // (len(runs) + 1)))
+
+# sorts the lines of src into dst (paths or binary file objects)
+# memory: bytes of input held in memory at once (python objects for the
+# lines of a chunk take roughly twice the raw size, chunks are sized for that)
+def external_sort(src, dst, memory=256 << 20, workers=1, tmpdir=None,
+                  field=None, numeric=False, reverse=False, fan_in=128):
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    # every worker holds one chunk being sorted, plus one being read
+    chunk = max(1 << 16, memory // (2 * (workers + 1)))
+    key = make_key(field, numeric)
+    with tempfile.TemporaryDirectory(dir=tmpdir) as tmp:
+        inp = open(src, 'rb') if isinstance(src, (str, os.PathLike)) else src
+        try:
+            if workers > 1:
+                runs, pending = [], []
+                with ProcessPoolExecutor(workers) as ex:
+                    for data in _chunks(inp, chunk):
+                        pending.append(ex.submit(_sort_run, data, tmp, field, numeric, reverse))
+                        if len(pending) >= workers:  # bound the chunks in flight
+                            runs.append(pending.pop(0).result())
+                    runs.extend(p.result() for p in pending)
+            else:
+                runs = [_sort_run(data, tmp, field, numeric, reverse) for data in _chunks(inp, chunk)]
+        finally:
+            if inp is not src:
+                inp.close()
+        out = open(dst, 'wb') if isinstance(dst, (str, os.PathLike)) else dst
+        try:
+            _merge_runs(runs, out, key, reverse, memory, fan_in, tmp)
+        finally:
+            if out is not dst:
+                out.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sort the lines of a file bigger than memory')
+    parser.add_argument('input', help='file to sort, - for stdin')
+    parser.add_argument('-o', '--output', default='-', help='output file, - for stdout (default)')
+    parser.add_argument('--memory', type=parse_size, default='256M', help='memory budget, e.g. 512M or 4G')
+    parser.add_argument('--workers', type=int, default=1, help='processes sorting runs in parallel')
+    parser.add_argument('--tmpdir', default=None, help='directory for the run files')
+    parser.add_argument('--key-field', type=int, default=None, dest='field',
+                        help='sort by this whitespace separated field (0 based)')
+    parser.add_argument('--numeric', action='store_true', help='compare the key as a number')
+    parser.add_argument('--reverse', action='store_true')
+    parser.add_argument('--fan-in', type=int, default=128, dest='fan_in', help='runs merged at once')
+    args = parser.parse_args(argv)
+
+    src = sys.stdin.buffer if args.input == '-' else args.input
+    dst = sys.stdout.buffer if args.output == '-' else args.output
+    external_sort(src, dst, memory=args.memory, workers=args.workers, tmpdir=args.tmpdir,
+                  field=args.field, numeric=args.numeric, reverse=args.reverse, fan_in=args.fan_in)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+from array import array
+# O(nlogn) sorting in place on lists, array.array and writable memoryviews.
+#
+#   merge_sort      bottom up merge sort, stable
+#   quick_sort      introsort: quicksort with median of three pivots, switches
+#                   to heapsort when the recursion gets too deep, not stable
+#   heap_sort       not stable, O(1) extra memory
+#   adaptive_sort   timsort style: finds the already sorted runs (reversing
+#                   descending ones), grows short runs with insertion sort and
+#                   merges them in a balanced order, stable and O(n) on sorted input
+#   sort(a, key=None, reverse=False, stable=True)  picks adaptive / quick
+#
+# Every function sorts `a` itself (no sorted() copy) and returns it.
+# Buffers stay buffers: an array('q') is sorted inside its own memory, only the
+# merge steps copy one run at a time. With key=, the keys are computed once
+# into a list k and every move on k is repeated on a (the v argument below).
+# Small ranges (<= SMALL) are finished with insertion sort.
+
+SMALL = 16
+
+def _swap(k, v, i, j):
+    k[i], k[j] = k[j], k[i]
+    if v is not None:
+        v[i], v[j] = v[j], v[i]
+
+def _reverse(k, v, lo, hi):
+    hi -= 1
+    while lo < hi:
+        _swap(k, v, lo, hi)
+        lo += 1
+        hi -= 1
+
+# copy of seq[lo:hi]; a memoryview slice is only a view, so copy its bytes
+def _copy(seq, lo, hi):
+    if isinstance(seq, memoryview):
+        buf = array(seq.format)
+        buf.frombytes(seq[lo:hi].cast("B"))
+        return buf
+    return seq[lo:hi]
+
+def _insertion(k, v, lo, hi):
+    for i in range(lo + 1, hi):
+        x = k[i]
+        if not x < k[i - 1]:
+            continue
+        y = v[i] if v is not None else None
+        j = i - 1
+        while j >= lo and x < k[j]:
+            k[j + 1] = k[j]
+            if v is not None:
+                v[j + 1] = v[j]
+            j -= 1
+        k[j + 1] = x
+        if v is not None:
+            v[j + 1] = y
+
+# stable merge of the sorted ranges [lo, mid) and [mid, hi), only the left
+# run is copied out; ties take from the left run first
+def _merge(k, v, lo, mid, hi):
+    if not k[mid] < k[mid - 1]:
+        return  # already in order
+    left = _copy(k, lo, mid)
+    lv = _copy(v, lo, mid) if v is not None else None
+    n1, i, j, o = mid - lo, 0, mid, lo
+    while i < n1 and j < hi:
+        if k[j] < left[i]:
+            k[o] = k[j]
+            if v is not None:
+                v[o] = v[j]
+            j += 1
+        else:
+            k[o] = left[i]
+            if v is not None:
+                v[o] = lv[i]
+            i += 1
+        o += 1
+    while i < n1:  # what is left of the right run is already in place
+        k[o] = left[i]
+        if v is not None:
+            v[o] = lv[i]
+        i += 1
+        o += 1
+
+def _merge_sort(k, v, lo, hi):
+    width = SMALL * 2
+    for s in range(lo, hi, width):
+        _insertion(k, v, s, min(s + width, hi))
+    while width < hi - lo:
+        for s in range(lo, hi - width, 2 * width):
+            _merge(k, v, s, s + width, min(s + 2 * width, hi))
+        width *= 2
+
+def _sift(k, v, lo, root, end):
+    while True:
+        c = 2 * root + 1
+        if c >= end:
+            return
+        if c + 1 < end and k[lo + c] < k[lo + c + 1]:
+            c += 1
+        if not k[lo + root] < k[lo + c]:
+            return
+        _swap(k, v, lo + root, lo + c)
+        root = c
+
+def _heap_sort(k, v, lo, hi):
+    n = hi - lo
+    for i in range(n // 2 - 1, -1, -1):
+        _sift(k, v, lo, i, n)
+    for end in range(n - 1, 0, -1):
+        _swap(k, v, lo, lo + end)
+        _sift(k, v, lo, 0, end)
+
+# hoare partition around the median of first / middle / last,
+# returns p with k[lo:p] <= pivot <= k[p:hi], both sides non empty
+def _partition(k, v, lo, hi):
+    mid = (lo + hi - 1) // 2
+    if k[mid] < k[lo]: _swap(k, v, mid, lo)
+    if k[hi - 1] < k[lo]: _swap(k, v, hi - 1, lo)
+    if k[hi - 1] < k[mid]: _swap(k, v, hi - 1, mid)
+    pivot = k[mid]
+    i, j = lo - 1, hi
+    while True:
+        i += 1
+        while k[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < k[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        _swap(k, v, i, j)
+
+def _introsort(k, v, lo, hi, depth=None):
+    if depth is None:
+        depth = 2 * max(1, hi - lo).bit_length()
+    while hi - lo > SMALL:
+        if depth == 0:  # quicksort is going quadratic, finish with heapsort
+            _heap_sort(k, v, lo, hi)
+            return
+        depth -= 1
+        p = _partition(k, v, lo, hi)
+        # recurse into the smaller side, loop on the bigger one -> O(logn) stack
+        if p - lo < hi - p:
+            _introsort(k, v, lo, p, depth)
+            lo = p
+        else:
+            _introsort(k, v, p, hi, depth)
+            hi = p
+    _insertion(k, v, lo, hi)
+
+def _minrun(n):
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+# length of the run starting at lo; a strictly descending run is reversed
+def _count_run(k, v, lo, hi):
+    r = lo + 1
+    if r == hi:
+        return 1
+    if k[r] < k[lo]:
+        while r < hi and k[r] < k[r - 1]:
+            r += 1
+        _reverse(k, v, lo, r)
+    else:
+        while r < hi and not k[r] < k[r - 1]:
+            r += 1
+    return r - lo
+
+def _merge_at(k, v, runs, i):
+    lo, n1 = runs[i]
+    n2 = runs[i + 1][1]
+    _merge(k, v, lo, lo + n1, lo + n1 + n2)
+    runs[i][1] = n1 + n2
+    del runs[i + 1]
+
+# keep run lengths growing like fibonacci numbers from the top of the stack
+# down, so every element takes part in O(logn) merges
+def _merge_collapse(k, v, runs):
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+           (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            return
+        _merge_at(k, v, runs, n)
+
+def _adaptive(k, v, lo, hi):
+    minrun = _minrun(hi - lo)
+    runs = []  # [start, length]
+    i = lo
+    while i < hi:
+        n = _count_run(k, v, i, hi)
+        if n < minrun:
+            n = min(minrun, hi - i)
+            _insertion(k, v, i, i + n)
+        runs.append([i, n])
+        i += n
+        _merge_collapse(k, v, runs)
+    while len(runs) > 1:
+        _merge_at(k, v, runs, len(runs) - 2)
+
+
+# reverse=True on a stable sort: reverse, sort, reverse back, so equal
+# items keep their original order (same as sorted(..., reverse=True))
+def _run(algo, a, key, reverse):
+    n = len(a)
+    k, v = (a, None) if key is None else ([key(x) for x in a], a)
+    if reverse:
+        _reverse(k, v, 0, n)
+    algo(k, v, 0, n)
+    if reverse:
+        _reverse(k, v, 0, n)
+    return a
+
+def insertion_sort(a, key=None, reverse=False):
+    return _run(_insertion, a, key, reverse)
+
+def merge_sort(a, key=None, reverse=False):
+    return _run(_merge_sort, a, key, reverse)
+
+def heap_sort(a, key=None, reverse=False):
+    return _run(_heap_sort, a, key, reverse)
+
+def quick_sort(a, key=None, reverse=False):
+    return _run(_introsort, a, key, reverse)
+
+def adaptive_sort(a, key=None, reverse=False):
+    return _run(_adaptive, a, key, reverse)
+
+def sort(a, key=None, reverse=False, stable=True):
+    return _run(_adaptive if stable else _introsort, a, key, reverse)
+
+
+if __name__ == "__main__":
+    import random
+    arr = array('q', (random.randrange(1000) for _ in range(20)))
+    print(sort(arr))
+    print(quick_sort(memoryview(array('d', [3.5, -1.0, 2.25, 0.0]))).tolist())
+    people = [("amy", 31), ("bob", 25), ("cid", 31), ("dan", 25)]
+    print(merge_sort(people, key=lambda p: p[1], reverse=True))
+    print(sort(list(range(10)) + list(range(10, 0, -1))))
@@ -15,8 +15,11 @@ def insertion_sort(arr):
         j = step -1
         key = arr[step]
 
-        while j >=0 and key < array[j]:
-            array[j+1] =array[j]
+        while j >=0 and key < arr[j]:
+            arr[j+1] =arr[j]
+            j -= 1
+        arr[j+1] = key
+    return arr
 
 
 arr = [5,6,4,3,2,1]
@@ -0,0 +1,262 @@
+from array import array
+from hybrid_sort import sort as _cmp_sort
+
+try:
+    import numpy as np
+except ImportError:  # the pure python bucket passes are used instead
+    np = None
+
+# Non comparison sorts for integer keys and fixed width keys: O(n * passes)
+# instead of O(nlogn) comparisons.
+#
+#   counting_sort(a)   ints in a small range [min, max], O(n + range) memory
+#   radix_sort(a)      LSD radix sort on ints of any range; with numpy also
+#                      floats and fixed width byte strings (dtype 'S<w>')
+#   msd_radix_sort(a)  list of bytes / str of any length, most significant byte first
+#   bucket_sort(a)     numbers spread roughly uniformly, n buckets
+#
+# a may be a list, array.array, memoryview or numpy array; it is sorted in
+# place and returned. With argsort=True a is left alone and the (stable)
+# permutation p with a[p[0]] <= a[p[1]] <= ... is returned instead.
+#
+# array('q') / memoryview buffers are wrapped by numpy without a copy
+# (np.frombuffer), so the passes run over the original memory. Each numpy
+# pass is a stable argsort of one 8 or 16 bit digit, which numpy itself does
+# with a counting (radix) sort, so a pass is O(n) with no python loop.
+# Keys are shifted by -min first, so only the digits that actually vary cost
+# a pass: timestamps from the same day need 3-4 passes, not 8.
+
+def _np_view(a):
+    if np is None:
+        return None
+    if isinstance(a, np.ndarray):
+        return a
+    if isinstance(a, array):
+        return np.frombuffer(a, dtype=a.typecode) if a.typecode not in 'uw' else None
+    if isinstance(a, memoryview):
+        return np.frombuffer(a, dtype=a.format) if a.ndim == 1 and not a.readonly else None
+    try:
+        x = np.asarray(a)
+    except (ValueError, OverflowError):
+        return None
+    if x.ndim != 1:
+        return None
+    # a list is only taken when numpy holds every value exactly: ints >= 2**63
+    # next to other ints, or ints mixed with floats, come out float64, and
+    # bytes lose trailing NULs
+    kind = x.dtype.kind
+    if kind in 'iu' or (kind == 'f' and all(type(v) is float for v in a)) \
+            or (kind == 'S' and not any(v.endswith(b'\0') for v in a)):
+        return x
+    return None
+
+# write the sorted values back into a
+def _store(a, values):
+    if np is not None and isinstance(values, np.ndarray):
+        if isinstance(a, list):
+            a[:] = values.tolist()
+        else:  # numpy array, or a numpy view over the buffer of a
+            _np_view(a)[...] = values
+    elif isinstance(a, list):
+        a[:] = values
+    else:
+        a[:] = array(a.typecode if isinstance(a, array) else a.format, values)
+    return a
+
+def _perm(n):
+    return array('q', range(n))
+
+# --- counting sort ----------------------------------------------------------
+
+def counting_sort(a, argsort=False, max_span=1 << 26):
+    n = len(a)
+    if n == 0:
+        return _perm(0) if argsort else a
+    x = _np_view(a)
+    if x is not None and x.dtype.kind not in 'iu':
+        x = None
+    lo, hi = (int(x.min()), int(x.max())) if x is not None else (min(a), max(a))
+    if hi - lo >= max_span:
+        raise ValueError(f"value range {hi - lo + 1} too large for counting sort, use radix_sort")
+    if x is not None:
+        if x.dtype.kind == 'u':  # x - lo >= 0 fits the type, uint64 may not fit int64
+            off = (x - x.dtype.type(lo)).astype(np.int64)
+        else:  # widen first: x - lo can overflow int8 / int16
+            off = x.astype(np.int64) - lo
+        if argsort:  # stable: equal values keep their input order
+            return np.argsort(off, kind='stable')
+        counts = np.bincount(off, minlength=hi - lo + 1)
+        return _store(a, np.repeat(np.arange(lo, hi + 1, dtype=x.dtype), counts))
+    counts = [0] * (hi - lo + 1)
+    for v in a:
+        counts[v - lo] += 1
+    if argsort:
+        start, s = counts, 0  # counts turned into the first slot of every value
+        for i, c in enumerate(counts):
+            start[i], s = s, s + c
+        p = array('q', bytes(8 * n))
+        for i, v in enumerate(a):
+            p[start[v - lo]] = i
+            start[v - lo] += 1
+        return p
+    out = []
+    for i, c in enumerate(counts):
+        if c:
+            out.extend([lo + i] * c)
+    return _store(a, out)
+
+# --- LSD radix sort ---------------------------------------------------------
+
+_SIGN = 1 << 63
+
+# 64 bit keys as uint64 in the same order as the input: floats get the
+# usual bit trick (negative: flip all bits, positive: flip the sign bit)
+def _u64_keys(x):
+    if x.dtype.kind == 'f':
+        b = x.astype(np.float64).view(np.uint64)
+        neg = (b >> np.uint64(63)).astype(bool)
+        return np.where(neg, ~b, b | np.uint64(_SIGN)), None
+    lo = int(x.min())
+    span = int(x.max()) - lo
+    # (x - lo) mod 2**64 is the true difference, it fits in [0, 2**64)
+    return x.astype(np.uint64) - np.uint64(lo & (2 ** 64 - 1)), span
+
+def _radix_np(x, digit_bits):
+    n = len(x)
+    if x.dtype.kind == 'S':
+        cols = x.view(np.uint8).reshape(n, x.dtype.itemsize)
+        perm = np.arange(n)
+        for c in range(cols.shape[1] - 1, -1, -1):  # last byte first
+            perm = perm[np.argsort(cols[perm, c], kind='stable')]
+        return perm
+    u, span = _u64_keys(x)
+    bits = 64 if span is None else span.bit_length()
+    dt = np.uint8 if digit_bits == 8 else np.uint16
+    perm = np.arange(n)
+    for shift in range(0, bits, digit_bits):
+        o = np.argsort((u >> np.uint64(shift)).astype(dt), kind='stable')
+        u = u[o]
+        perm = perm[o]
+    return perm
+
+def _radix_py(a, argsort):
+    lo = min(a)
+    bits = (max(a) - lo).bit_length()
+    idx = list(range(len(a)))
+    for shift in range(0, bits, 8):
+        buckets = [[] for _ in range(256)]
+        for i in idx:
+            buckets[((a[i] - lo) >> shift) & 0xFF].append(i)
+        idx = [i for b in buckets for i in b]
+    return array('q', idx) if argsort else [a[i] for i in idx]
+
+def radix_sort(a, argsort=False, digit_bits=16):
+    if digit_bits not in (8, 16):
+        raise ValueError("digit_bits must be 8 or 16")
+    if len(a) == 0:
+        return _perm(0) if argsort else a
+    x = _np_view(a)
+    if x is None:
+        if not all(isinstance(v, int) for v in a):
+            raise TypeError("radix_sort sorts ints, or with numpy lists of only floats / bytes (msd_radix_sort for any bytes / str)")
+        res = _radix_py(a, argsort)
+        return res if argsort else _store(a, res)
+    perm = _radix_np(x, digit_bits)
+    return perm if argsort else _store(a, x[perm])
+
+# --- MSD radix sort for variable length strings -----------------------------
+
+# buckets by the byte at depth d (bucket 0: string already ended) and
+# recurses (with an explicit stack) into every bucket holding 2+ strings.
+# str is compared through its utf-8 bytes, which keeps code point order.
+# small buckets are finished by the comparison sort.
+def msd_radix_sort(a, argsort=False, small=32):
+    keys = [s.encode() if isinstance(s, str) else s for s in a]
+    idx = list(range(len(keys)))
+    stack = [(0, len(idx), 0)]
+    while stack:
+        lo, hi, d = stack.pop()
+        if hi - lo <= small:
+            part = idx[lo:hi]
+            _cmp_sort(part, key=lambda i: keys[i][d:])
+            idx[lo:hi] = part
+            continue
+        buckets = [[] for _ in range(257)]
+        for i in idx[lo:hi]:
+            s = keys[i]
+            buckets[s[d] + 1 if d < len(s) else 0].append(i)
+        pos = lo
+        for b, items in enumerate(buckets):
+            if not items:
+                continue
+            idx[pos:pos + len(items)] = items
+            if b and len(items) > 1:
+                stack.append((pos, pos + len(items), d + 1))
+            pos += len(items)
+    if argsort:
+        return array('q', idx)
+    a[:] = [a[i] for i in idx]
+    return a
+
+# --- bucket sort ------------------------------------------------------------
+
+# n buckets over [min, max]; with uniformly spread values every bucket holds
+# O(1) items, so the per bucket insertion sorts are O(n) overall
+# buckets hold indices, every bucket is sorted by value (stably). -inf / inf
+# go before / after the finite values and NaN last, like numpy.sort.
+def bucket_sort(a, nbuckets=None, argsort=False):
+    n = len(a)
+    finite = [i for i in range(n) if a[i] - a[i] == 0]  # false for inf and NaN
+    low = [i for i in range(n) if a[i] == float('-inf')]
+    high = [i for i in range(n) if a[i] == float('inf')]
+    nan = [i for i in range(n) if a[i] != a[i]]
+    order = low
+    if finite:
+        lo, hi = min(a[i] for i in finite), max(a[i] for i in finite)
+        nb = nbuckets or len(finite)
+        scale = nb / (hi - lo) if hi > lo else 0
+        buckets = [[] for _ in range(nb)]
+        for i in finite:
+            buckets[min(int((a[i] - lo) * scale), nb - 1)].append(i)
+        for b in buckets:
+            _cmp_sort(b, key=a.__getitem__)
+            order.extend(b)
+    order += high + nan
+    if argsort:
+        return array('q', order)
+    values = [a[i] for i in order]
+    for pos, v in enumerate(values):
+        a[pos] = v
+    return a
+
+
+if __name__ == "__main__":
+    import random, time
+    ts = array('q', (1_700_000_000_000_000_000 + random.randrange(10 ** 12) for _ in range(10)))
+    print(radix_sort(ts))
+    print(radix_sort([170, -45, 75, -90, 802, 24, 2, 66], argsort=True))
+    print(counting_sort([4, 1, 3, 1, 0, 4, 2]))
+    print(msd_radix_sort(["banana", "apple", "app", "cherry", "", "apricot"]))
+    print(bucket_sort([0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51]))
+    print(bucket_sort([0.5, float('nan'), float('inf'), -1.0, float('-inf'), 0.5], argsort=True))
+    # lists numpy would turn into float64: big ints stay exact ints, mixed int / float is refused
+    big = [2 ** 63 + 1, 2 ** 63, 1, 2 ** 70]
+    assert radix_sort(list(big)) == sorted(big) and radix_sort(big, argsort=True).tolist() == [2, 1, 0, 3]
+    try:
+        radix_sort([3, 1.5, 2])
+        raise AssertionError("mixed int / float list was sorted")
+    except TypeError:
+        pass
+    # narrow signed types: the offsets from min do not fit the input type
+    for x in (array('b', [100, -100, 5]), array('h', [30000, -30000, 5, -30000])):
+        assert counting_sort(x, argsort=True).tolist() == sorted(range(len(x)), key=x.__getitem__)
+        assert radix_sort(x, argsort=True).tolist() == sorted(range(len(x)), key=x.__getitem__)
+        assert counting_sort(array(x.typecode, x)).tolist() == sorted(x)
+        if np is not None:
+            assert counting_sort(np.array(x, dtype=x.typecode)).tolist() == sorted(x)
+    if np is not None:
+        big = array('q', (random.randrange(-2 ** 63, 2 ** 63) for _ in range(10 ** 6)))
+        lst = big.tolist()
+        t = time.perf_counter(); sorted(lst); t1 = time.perf_counter() - t
+        t = time.perf_counter(); radix_sort(big); t2 = time.perf_counter() - t
+        print(f"sorted: {t1:.3f}s  radix_sort: {t2:.3f}s", big.tolist() == sorted(lst))